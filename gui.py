@@ -5,7 +5,7 @@ Timeline + waveform + player vidéo intégré
 import os
 import sys
 import time
-import threading
+from bisect import bisect_left, bisect_right
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ÉTAPE -1 — PRÉ-CHARGEMENT TORCH / CTRANSLATE2 AVANT PyQt6
@@ -55,7 +55,11 @@ def _setup_qt6_path():
         plug_dir = os.path.join(sp, "PyQt6", "Qt6", "plugins", "multimedia")
         if os.path.isdir(qt6_bin):
             cur = os.environ.get("PATH", "")
-            if qt6_bin.lower() not in cur.lower():
+            # Comparaison par entrée (et non sous-chaîne) : "...\Qt6\bin" ne
+            # doit pas matcher "...\Qt6\bin_old"
+            entries = {os.path.normcase(os.path.normpath(e))
+                       for e in cur.split(os.pathsep) if e}
+            if os.path.normcase(os.path.normpath(qt6_bin)) not in entries:
                 os.environ["PATH"] = qt6_bin + os.pathsep + cur
                 print(f"[VS] Qt6/bin ajouté au PATH : {qt6_bin}")
             else:
@@ -101,10 +105,6 @@ def _check_deps():
         import numpy
     except ImportError:
         missing.append("numpy  →  pip install numpy")
-    try:
-        import pydub
-    except ImportError:
-        missing.append("pydub  →  pip install pydub")
     if missing:
         msg = "Dépendances manquantes :\n\n" + "\n".join(missing)
         msg += "\n\nLancez le .bat pour les installer automatiquement."
@@ -147,15 +147,8 @@ except ImportError as _qm_err:
     print(f"[VS] ⚠ QtMultimedia import échoué : {_qm_err}")
     QMEDIA_OK = False
 
-try:
-    from PIL import Image
-    PIL_OK = True
-except ImportError:
-    PIL_OK = False
-
 # ── Import du moteur de traitement vidéo (FFmpeg, zéro moviepy) ──────────────
 import reel_maker as rm
-from pydub import AudioSegment
 
 # ──────────────────────────────────────────────────────────────────────────────
 # PALETTE COULEURS
@@ -270,24 +263,12 @@ class AnalysisWorker(QThread):
                 self.video_path,
                 silence_thresh=self.thresh,
                 min_silence_len=self.min_len,
-                progress_callback=lambda p, m: self.progress.emit(p, m)
+                progress_callback=self.progress.emit
             )
             # Génération de la waveform depuis le WAV extrait
             self.progress.emit(0.85, "Génération de la waveform...")
-            audio_path = os.path.join(rm.CONFIG["TEMP_DIR"], "temp_audio.wav")
-            audio = AudioSegment.from_wav(audio_path)
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
-            if audio.channels == 2:
-                samples = samples.reshape(-1, 2).mean(axis=1)
-            # Downsample to ~4000 points for display
-            n_display = 4000
-            if len(samples) > n_display:
-                step = len(samples) // n_display
-                samples = np.abs(samples[:step * n_display].reshape(-1, step)).max(axis=1)
-            else:
-                samples = np.abs(samples)
-            if samples.max() > 0:
-                samples = samples / samples.max()
+            # ~4000 points pour l'affichage, lus par blocs (pas de WAV entier en RAM)
+            samples = rm.load_waveform(rm.analysis_audio_path(self.video_path), 4000)
             self.progress.emit(1.0, f"{len(silences)} silence(s) détecté(s).")
             self.finished.emit(video_info, silences, samples, None, working_path)
         except Exception as e:
@@ -308,13 +289,19 @@ class AssemblyWorker(QThread):
 
     def run(self):
         try:
-            cb = lambda p, m: self.progress.emit(p, m)
+            # emit lié directement : pas de closure intermédiaire par appel
+            cb = self.progress.emit
+            # Modèle Whisper chargé en parallèle de l'encodage FFmpeg
+            rm.preload_whisper_model()
+            # L'audio Whisper est extrait dans la même passe FFmpeg,
+            # la transcription qui suit démarre donc sans re-décoder la vidéo.
             rm.assemble_clips(
                 self._video_path,
                 self._silences,
                 self._decisions,
                 self._raw_cut_path,
                 cb,
+                audio_path=rm.CUT_AUDIO_PATH,
             )
             self.finished.emit(self._raw_cut_path)
         except Exception as e:
@@ -332,8 +319,9 @@ class TranscriptionWorker(QThread):
 
     def run(self):
         try:
-            cb = lambda p, m: self.progress.emit(p, m)
-            words_data, txt_path = rm.transcribe(self._path, cb)
+            cb = self.progress.emit
+            words_data, txt_path = rm.transcribe(self._path, cb,
+                                                 audio_path=rm.CUT_AUDIO_PATH)
             self.finished.emit(words_data, txt_path)
         except Exception as e:
             self.error.emit(str(e))
@@ -359,7 +347,7 @@ class ExportWorker(QThread):
     def run(self):
         try:
             final_words = rm.load_subs_from_file(self._txt_path)
-            cb = lambda p, m: self.progress.emit(p, m)
+            cb = self.progress.emit
             rm.burn_subtitles(
                 self._raw_cut_path, final_words, self._out_path, cb,
                 music_path=self._music_path,
@@ -382,7 +370,6 @@ class TimelineWidget(QWidget):
     cut_placed             = pyqtSignal(float)  # ms — razor cut placed here
     cut_mode_exit_requested = pyqtSignal()      # Escape pressed in cut mode
     scroll_changed         = pyqtSignal(int, int) # value, max_value
-    scroll_changed         = pyqtSignal(int, int) # value, max_value
 
     RULER_H   = 22
     WAVE_H    = 60
@@ -421,36 +408,32 @@ class TimelineWidget(QWidget):
         self.update()
 
     def _init_segments(self, silences, decisions, duration_ms):
-        """Convert silence list into boundary/segment model."""
-        bset = {0, int(duration_ms)}
-        for s, e in silences:
-            bset.add(int(s)); bset.add(int(e))
-        self._boundaries = sorted(bset)
-        self._seg_keep = []
-        for i in range(len(self._boundaries) - 1):
-            ss, se = self._boundaries[i], self._boundaries[i + 1]
-            keep = True
-            for j, (s, e) in enumerate(silences):
-                if ss >= s and se <= e:
-                    keep = not (decisions[j] if j < len(decisions) else True)
-                    break
-            self._seg_keep.append(keep)
+        """Convert silence list into boundary/segment model (vectorised with numpy)."""
+        sil = np.asarray(silences, dtype=np.int64).reshape(-1, 2)
+        bounds = np.unique(np.concatenate(([0, int(duration_ms)], sil.ravel())))
+        self._boundaries = bounds.tolist()
+        if len(sil) == 0:
+            self._seg_keep = [True] * (len(bounds) - 1)
+            return
+        # Missing decisions default to True (= cut)
+        dec = np.ones(len(sil), dtype=bool)
+        n = min(len(decisions), len(sil))
+        dec[:n] = np.asarray(decisions[:n], dtype=bool)
+        order = np.argsort(sil[:, 0], kind="stable")
+        sil_s, sil_e, dec = sil[order, 0], sil[order, 1], dec[order]
+        # For each interval: last silence starting at or before it, if it covers it
+        seg_s, seg_e = bounds[:-1], bounds[1:]
+        j = np.searchsorted(sil_s, seg_s, side="right") - 1
+        jc = np.clip(j, 0, None)
+        inside = (j >= 0) & (seg_e <= sil_e[jc])
+        self._seg_keep = np.where(inside, ~dec[jc], True).tolist()
 
     def set_playhead(self, ms):
+        # Repeindre seulement si la tête de lecture change de pixel
+        old_x = self._ms_to_px(self.playhead_ms)
         self.playhead_ms = ms
-        self.update()
-
-    # ── Scroll & Pan helpers ──────────────────────────────────────────────────
-
-    def _emit_scroll(self):
-        max_scroll = int(max(0, (self.duration_ms * self._zoom) - self.width() + 20))
-        # Clamp _scroll_px to valid range
-        self._scroll_px = max(0, min(self._scroll_px, max_scroll))
-        self.scroll_changed.emit(self._scroll_px, max_scroll)
-
-    def set_scroll(self, scroll_px):
-        self._scroll_px = scroll_px
-        self.update()
+        if self._ms_to_px(ms) != old_x:
+            self.update()
 
     # ── Scroll & Pan helpers ──────────────────────────────────────────────────
 
@@ -479,15 +462,13 @@ class TimelineWidget(QWidget):
     def add_boundary_at(self, ms):
         """Razor-cut: split the segment at ms. Both halves inherit parent decision."""
         ms = int(round(ms))
-        if ms in self._boundaries:
+        b = self._boundaries
+        i = bisect_left(b, ms)   # _boundaries est trié : O(log N)
+        if i == 0 or i >= len(b) or b[i] == ms:
             return
-        for i in range(len(self._boundaries) - 1):
-            if self._boundaries[i] < ms < self._boundaries[i + 1]:
-                keep = self._seg_keep[i]
-                self._boundaries.insert(i + 1, ms)
-                self._seg_keep.insert(i + 1, keep)
-                self.update()
-                return
+        self._boundaries.insert(i, ms)
+        self._seg_keep.insert(i, self._seg_keep[i - 1])
+        self.update()
 
     def set_cut_mode(self, enabled: bool):
         self._cut_mode = enabled
@@ -506,10 +487,10 @@ class TimelineWidget(QWidget):
     def _segment_at(self, px):
         """Return segment index at pixel x, or -1."""
         ms = self._px_to_ms(px)
-        for i in range(len(self._boundaries) - 1):
-            if self._boundaries[i] <= ms <= self._boundaries[i + 1]:
-                return i
-        return -1
+        b = self._boundaries
+        if len(b) < 2 or ms < b[0] or ms > b[-1]:
+            return -1
+        return max(0, bisect_left(b, ms) - 1)
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -566,9 +547,13 @@ class TimelineWidget(QWidget):
         p.fillRect(0, seg_y, w, self.SEG_H, C_BG)
         if self._boundaries:
             p.setFont(QFont("Segoe UI", 8))
-            for i in range(len(self._boundaries) - 1):
-                x1 = self._ms_to_px(self._boundaries[i])
-                x2 = self._ms_to_px(self._boundaries[i + 1])
+            # Ne dessiner que les segments visibles (recherche dichotomique)
+            b = self._boundaries
+            first = max(0, bisect_right(b, self._px_to_ms(0)) - 1)
+            last  = min(len(b) - 1, bisect_left(b, self._px_to_ms(w)) + 1)
+            for i in range(first, last):
+                x1 = self._ms_to_px(b[i])
+                x2 = self._ms_to_px(b[i + 1])
                 keep   = self._seg_keep[i] if i < len(self._seg_keep) else True
                 color  = QColor("#1e3a2a") if keep else QColor("#3b0a0a")
                 border = C_GREEN if keep else C_RED
@@ -582,7 +567,7 @@ class TimelineWidget(QWidget):
                     p.drawText(r, Qt.AlignmentFlag.AlignCenter, label)
             # Razor cut markers (boundaries that aren't 0 or duration)
             p.setPen(QPen(C_FG2, 1))
-            for ms in self._boundaries[1:-1]:
+            for ms in b[max(1, first):min(last, len(b) - 1)]:
                 bx = self._ms_to_px(ms)
                 if 0 <= bx <= w:
                     p.drawLine(bx, seg_y, bx, seg_y + self.SEG_H)
@@ -708,12 +693,11 @@ class TimelineWidget(QWidget):
 
     @staticmethod
     def _fmt(ms):
-        s = ms / 1000
-        m = int(s // 60)
-        s = s % 60
+        # Dixièmes de seconde entiers + divmod (pas de flottants à formater)
+        m, ds = divmod(int(ms + 50) // 100, 600)
         if m > 0:
-            return f"{m}:{s:04.1f}"
-        return f"{s:.1f}s"
+            return f"{m}:{ds // 10:02d}.{ds % 10}"
+        return f"{ds // 10}.{ds % 10}s"
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -730,7 +714,20 @@ class VideoPlayerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._duration        = 0.0
+        self._duration_ms     = 0
+        self._dur_str         = self._fmt_time(0.0)   # partie fixe du libellé
         self._slider_dragging = False
+        self._source_path     = None   # fichier actuellement chargé
+        # Le libellé de temps est rafraîchi au plus 10×/s (positionChanged
+        # arrive à chaque frame) : on garde la dernière position reçue.
+        self._label_pos   = 0.0
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(100)
+        self._label_timer.timeout.connect(self._flush_time_label)
+        # Ticks plus rapprochés que 10 ms ignorés pendant la lecture
+        self._playing        = False
+        self._last_tick_mono = 0.0
         self._build_ui()
 
     def _build_ui(self):
@@ -820,6 +817,7 @@ class VideoPlayerWidget(QWidget):
         self._sub_overlay.setGraphicsEffect(effect)
         self._sub_overlay.setText("")
         self._sub_overlay.hide()
+        self._sub_text = ""
 
         # Seekbar
         self._seekbar = QSlider(Qt.Orientation.Horizontal)
@@ -846,7 +844,8 @@ class VideoPlayerWidget(QWidget):
         self._btn_play.clicked.connect(self.toggle_play)
         self._btn_next.clicked.connect(self._skip_fwd)
 
-        self._time_lbl = QLabel("00:00 / 00:00")
+        self._time_text = "00:00 / 00:00"
+        self._time_lbl = QLabel(self._time_text)
         self._time_lbl.setStyleSheet("color: #9896b8; font-size: 12px;")
 
         ctrl.addWidget(self._btn_prev)
@@ -865,6 +864,10 @@ class VideoPlayerWidget(QWidget):
             self._sub_overlay.setGeometry(0, 0, w, h - 30)
 
     def update_subtitle(self, text):
+        # Appelé à chaque tick de position : ne toucher au QLabel que si le texte change
+        if text == getattr(self, '_sub_text', None):
+            return
+        self._sub_text = text
         if hasattr(self, '_sub_overlay'):
             if text:
                 self._sub_overlay.setText(text)
@@ -887,29 +890,41 @@ class VideoPlayerWidget(QWidget):
             return
         self._media.stop()
         if video_path:
-            self._media.setSource(QUrl.fromLocalFile(os.path.abspath(video_path)))
+            path = os.path.abspath(video_path)
+            # Même fichier (ré-analyse) : on garde la source déjà ouverte
+            if path != self._source_path:
+                self._media.setSource(QUrl.fromLocalFile(path))
+                self._source_path = path
         if video:
-            self._duration = video.duration  # updated by durationChanged signal
+            self._set_duration(video.duration)  # updated by durationChanged signal
         self._update_time_label(0.0)
 
     def unload(self):
         if self._media:
             self._media.stop()
             self._media.setSource(QUrl())
-        self._duration = 0.0
+        self._source_path = None
+        self._set_duration(0.0)
         self._seekbar.setValue(0)
-        self._time_lbl.setText("00:00 / 00:00")
+        self._time_text = "00:00 / 00:00"
+        self._time_lbl.setText(self._time_text)
 
     def seek(self, seconds):
         if not self._media:
             return
-        ms = max(0, min(int(seconds * 1000), int(self._duration * 1000)))
+        ms = max(0, min(int(seconds * 1000), self._duration_ms))
         self._media.setPosition(ms)
 
+    def pause(self):
+        """Met la lecture en pause (libère le décodeur pendant les rendus FFmpeg)."""
+        if self._media and self._media.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            self._media.pause()
+
     def toggle_play(self):
         if not self._media:
             return
-        if self._media.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+        # État suivi localement par _on_state_changed : pas de requête au backend
+        if self._playing:
             self._media.pause()
         else:
             self._media.play()
@@ -923,25 +938,38 @@ class VideoPlayerWidget(QWidget):
 
     # ── QMediaPlayer signal handlers ──────────────────────────────────────────
 
+    _TICK_MIN_DT = 0.01
+
     def _on_position_changed(self, ms):
+        if self._playing:
+            # En pause, chaque tick vient d'un seek : on ne filtre jamais
+            now = time.monotonic()
+            if now - self._last_tick_mono < self._TICK_MIN_DT:
+                return
+            self._last_tick_mono = now
         seconds = ms / 1000.0
-        if not self._slider_dragging and self._duration > 0:
-            val = int(ms / (self._duration * 1000) * 10000)
+        if not self._slider_dragging and self._duration_ms > 0:
+            val = ms * 10000 // self._duration_ms
             self._seekbar.blockSignals(True)
             self._seekbar.setValue(val)
             self._seekbar.blockSignals(False)
-        self._update_time_label(seconds)
+        self._label_pos = seconds
+        if not self._label_timer.isActive():
+            self._label_timer.start()
         self.position_changed.emit(seconds)
 
     def _on_duration_changed(self, ms):
         if ms > 0:
-            self._duration = ms / 1000.0
+            self._set_duration(ms / 1000.0)
+
+    _PLAY_TXT = ("▶", "⏸")   # indexé par l'état lecture (False/True)
 
     def _on_state_changed(self, state):
-        if state == QMediaPlayer.PlaybackState.PlayingState:
-            self._btn_play.setText("⏸")
-        else:
-            self._btn_play.setText("▶")
+        playing = state == QMediaPlayer.PlaybackState.PlayingState
+        if playing == self._playing:
+            return      # Stopped ↔ Paused : même icône
+        self._playing = playing
+        self._btn_play.setText(self._PLAY_TXT[playing])
 
     # ── Seekbar ───────────────────────────────────────────────────────────────
 
@@ -955,7 +983,7 @@ class VideoPlayerWidget(QWidget):
     def _on_slider_released(self):
         self._slider_dragging = False
         if self._media and self._duration > 0:
-            ms = int(self._seekbar.value() / 10000 * self._duration * 1000)
+            ms = self._seekbar.value() * self._duration_ms // 10000
             self._media.setPosition(ms)
 
     def _skip_back(self):
@@ -964,11 +992,28 @@ class VideoPlayerWidget(QWidget):
     def _skip_fwd(self):
         self.seek(min(self._duration, self._pos + 5.0))
 
+    def _flush_time_label(self):
+        self._update_time_label(self._label_pos)
+
+    _TIME_FMT = "{:02d}:{:02d}.{:02d}".format
+
+    @classmethod
+    def _fmt_time(cls, s):
+        # Un seul passage en centièmes entiers puis deux divmod
+        mins, rem = divmod(int(s * 100), 6000)
+        return cls._TIME_FMT(mins, *divmod(rem, 100))
+
+    def _set_duration(self, seconds):
+        # La durée ne change qu'au chargement : formatée une seule fois
+        self._duration    = seconds
+        self._duration_ms = int(seconds * 1000)
+        self._dur_str  = self._fmt_time(seconds)
+
     def _update_time_label(self, seconds):
-        def fmt(s):
-            m = int(s // 60)
-            return f"{m:02d}:{s % 60:05.2f}"
-        self._time_lbl.setText(f"{fmt(seconds)} / {fmt(self._duration)}")
+        text = f"{self._fmt_time(seconds)} / {self._dur_str}"
+        if text != self._time_text:     # même centième : pas de relayout du QLabel
+            self._time_text = text
+            self._time_lbl.setText(text)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -997,6 +1042,8 @@ class RightPanel(QWidget):
         # Tab 3 — Export
         self._tab_export = self._build_tab_export()
         self._tabs.addTab(self._tab_export, "🚀  Export")
+        # La liste des musiques n'est lue qu'à l'ouverture de l'onglet
+        self._tabs.currentChanged.connect(self._on_tab_changed)
 
 
 
@@ -1014,6 +1061,11 @@ class RightPanel(QWidget):
         self._sub_editor = QPlainTextEdit()
         self._sub_editor.setPlaceholderText("Les sous-titres apparaîtront ici après la transcription...")
         v.addWidget(self._sub_editor, 1)
+        # True quand l'éditeur diffère du fichier sur disque (édition ou rechargement
+        # regroupé par phrases) — évite de réécrire le fichier à chaque export.
+        self._subs_dirty = False
+        self._live_subs  = None    # cache de get_live_subs(), invalidé à chaque édition
+        self._sub_editor.textChanged.connect(self._mark_subs_dirty)
 
         row = QHBoxLayout()
         self._btn_save_subs   = btn("💾  Sauvegarder", "#242336", 130)
@@ -1064,15 +1116,26 @@ class RightPanel(QWidget):
             i += max_w
         self._sub_editor.setPlainText("\n".join(lines))
 
+    def _mark_subs_dirty(self):
+        self._subs_dirty = True
+        self._live_subs  = None
+
     def _save_subs(self):
+        if not self._subs_dirty:
+            return
         if hasattr(self, "_txt_path") and self._txt_path:
             with open(self._txt_path, "w", encoding="utf-8") as f:
                 f.write(self._sub_editor.toPlainText())
+            self._subs_dirty = False
 
     def get_txt_path(self):
         return getattr(self, "_txt_path", None)
 
     def get_live_subs(self):
+        # Appelé à chaque position du lecteur : le texte n'est re-parsé
+        # qu'après une modification de l'éditeur.
+        if self._live_subs is not None:
+            return self._live_subs
         subs = []
         text = self._sub_editor.toPlainText()
         for line in text.split('\n'):
@@ -1086,6 +1149,7 @@ class RightPanel(QWidget):
                     phrase = parts[2]
                     subs.append({'start': s, 'end': e, 'phrase': phrase})
                 except ValueError: pass
+        self._live_subs = subs
         return subs
 
     # ── Tab Musique de fond ────────────────────────────────────────────────────
@@ -1129,7 +1193,7 @@ class RightPanel(QWidget):
         # Buttons
         row = QHBoxLayout()
         self._btn_refresh_music = btn("🔄  Rafraîchir", "#242336", 120)
-        self._btn_refresh_music.clicked.connect(self._refresh_music_list)
+        self._btn_refresh_music.clicked.connect(lambda: self._refresh_music_list(force=True))
         self._btn_no_music = btn("🚫  Aucune musique", "#242336", 140)
         self._btn_no_music.clicked.connect(lambda: self._music_list.clearSelection())
         row.addWidget(self._btn_refresh_music)
@@ -1137,18 +1201,28 @@ class RightPanel(QWidget):
         row.addStretch()
         v.addLayout(row)
 
-        # Créer le dossier music/ s'il n'existe pas
+        # Dossier music/ : créé et scanné au premier affichage de l'onglet
         self._music_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "music")
-        os.makedirs(self._music_dir, exist_ok=True)
-        self._refresh_music_list()
+        self._music_scanned_at = 0.0
         return w
 
-    def _refresh_music_list(self):
+    def _on_tab_changed(self, idx):
+        if self._tabs.widget(idx) is self._tab_music:
+            self._refresh_music_list()
+
+    def _refresh_music_list(self, force=False):
+        # Pas de re-scan si la liste a été lue il y a moins de 2 s
+        now = time.monotonic()
+        if not force and now - self._music_scanned_at < 2.0:
+            return
+        self._music_scanned_at = now
+        rm.ensure_dir(self._music_dir)
         self._music_list.clear()
         exts = (".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a")
         if os.path.isdir(self._music_dir):
-            files = sorted(f for f in os.listdir(self._music_dir)
-                           if f.lower().endswith(exts))
+            with os.scandir(self._music_dir) as it:
+                files = sorted(e.name for e in it
+                               if e.is_file() and e.name.lower().endswith(exts))
             for f in files:
                 self._music_list.addItem(f)
         if self._music_list.count() == 0:
@@ -1295,10 +1369,11 @@ class DebugPanel(QWidget):
         self._log.setFixedHeight(120)
         layout.addWidget(self._log)
 
+    _ICONS = {"INFO": "·", "WARN": "⚠", "ERROR": "✖", "DEBUG": "›", "OK": "✔"}
+
     def log(self, msg: str, level: str = "INFO"):
         ts    = time.strftime("%H:%M:%S")
-        icons = {"INFO": "·", "WARN": "⚠", "ERROR": "✖", "DEBUG": "›", "OK": "✔"}
-        icon  = icons.get(level, "·")
+        icon  = self._ICONS.get(level, "·")
         self._log.appendPlainText(f"[{ts}] {icon} {msg}")
         sb = self._log.verticalScrollBar()
         sb.setValue(sb.maximum())
@@ -1328,6 +1403,13 @@ class VibeSlicer(QMainWindow):
         # Manual cut In/Out points (ms)
         self._in_ms         = None
         self._out_ms        = None
+        # Synchro lecteur → timeline/sous-titres : seule la dernière position
+        # reçue est appliquée, au plus une fois par frame (~60 Hz)
+        self._pending_pos   = None
+        self._sync_timer    = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(16)
+        self._sync_timer.timeout.connect(self._apply_player_position)
 
         self._build_ui()
         self.setStyleSheet(STYLE_MAIN)
@@ -1594,7 +1676,7 @@ class VibeSlicer(QMainWindow):
     def _on_analysis_progress(self, p, msg):
         self._progress.setValue(int(p * 100))
         self._progress_lbl.setText(msg)
-        self._dbg(f"[Analyse {int(p*100)}%] {msg}")
+        self._dbg(f"[Analyse {int(p*100)}%] {msg}", "DEBUG")
 
     def _on_analysis_done(self, video, silences, waveform, audio, working_path):
         self._dbg(f"Analyse terminée — {len(silences)} silence(s)", "OK")
@@ -1658,6 +1740,14 @@ class VibeSlicer(QMainWindow):
     # ── PLAYER / TIMELINE SYNC ────────────────────────────────────────────────
 
     def _on_player_position(self, seconds):
+        self._pending_pos = seconds
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def _apply_player_position(self):
+        seconds, self._pending_pos = self._pending_pos, None
+        if seconds is None:
+            return
         self._timeline.set_playhead(seconds * 1000)
         # Live subtitle preview
         active_sub = ""
@@ -1678,7 +1768,10 @@ class VibeSlicer(QMainWindow):
         self._debug_panel.setVisible(checked)
 
     def _dbg(self, msg, level="INFO"):
-        self._debug_panel.log(msg, level)
+        # Les traces DEBUG (ticks de progression) ne sont journalisées que
+        # si le panneau est ouvert ; la barre d'état est toujours mise à jour.
+        if level != "DEBUG" or self._debug_panel.isVisible():
+            self._debug_panel.log(msg, level)
         self._statusbar.showMessage(msg)
 
     # ── CUT TOOL TOGGLE ───────────────────────────────────────────────────────
@@ -1697,6 +1790,7 @@ class VibeSlicer(QMainWindow):
     def _start_assemble(self):
         if not self._video_obj:
             return
+        self._player.pause()
         self._btn_assemble.setEnabled(False)
         self._progress.setValue(0)
         self._progress_lbl.setText("Assemblage en cours...")
@@ -1723,7 +1817,7 @@ class VibeSlicer(QMainWindow):
     def _on_assemble_progress(self, p, msg):
         self._progress.setValue(int(p * 100))
         self._progress_lbl.setText(msg)
-        self._dbg(f"[Assemblage {int(p*100)}%] {msg}")
+        self._dbg(f"[Assemblage {int(p*100)}%] {msg}", "DEBUG")
 
     def _on_assemble_done(self, raw_cut_path):
         self._raw_cut_path = raw_cut_path
@@ -1754,7 +1848,7 @@ class VibeSlicer(QMainWindow):
     def _on_transcribe_progress(self, p, msg):
         self._progress.setValue(int(p * 100))
         self._progress_lbl.setText(msg)
-        self._dbg(f"[Transcription {int(p*100)}%] {msg}")
+        self._dbg(f"[Transcription {int(p*100)}%] {msg}", "DEBUG")
 
     def _on_transcribe_done(self, words_data, txt_path):
         self._txt_path = txt_path
@@ -1786,6 +1880,7 @@ class VibeSlicer(QMainWindow):
         name_root = os.path.splitext(os.path.basename(self._video_path))[0]
         out_path = os.path.join(rm.CONFIG["OUTPUT_DIR"], f"Reel_Ready_{name_root}.mp4")
 
+        self._player.pause()
         self._right._btn_export.setEnabled(False)
         self._right.set_export_progress(0.0, "Export en cours...")
         self._statusbar.showMessage("Export de la vidéo finale...")
@@ -1807,7 +1902,7 @@ class VibeSlicer(QMainWindow):
 
     def _on_export_progress(self, p, msg):
         self._right.set_export_progress(p, msg)
-        self._dbg(f"[Export {int(p*100)}%] {msg}")
+        self._dbg(f"[Export {int(p*100)}%] {msg}", "DEBUG")
 
     def _on_export_done(self, out_path):
         self._right.set_export_done(out_path)
@@ -1819,6 +1914,13 @@ class VibeSlicer(QMainWindow):
         self._dbg(f"Erreur export : {err}", "ERROR")
         self._statusbar.showMessage(f"❌ {err}")
 
+    # ── FERMETURE ─────────────────────────────────────────────────────────────
+
+    def closeEvent(self, event):
+        # Relâcher la source QMediaPlayer (handle fichier + décodeur) avant la sortie
+        self._player.unload()
+        super().closeEvent(event)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # ENTRY POINT
@@ -1855,9 +1957,9 @@ if __name__ == "__main__":
     try:
         import subprocess as _sp
         _r = _sp.run(
-            ["ffmpeg", "-version"],
-            stdout=_sp.PIPE, stderr=_sp.PIPE,
-            creationflags=_sp.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            [rm.find_executable("ffmpeg"), "-version"],
+            stdout=_sp.DEVNULL, stderr=_sp.DEVNULL,
+            **rm.SPAWN_KW,
         )
         if _r.returncode != 0:
             raise RuntimeError("ffmpeg -version a retourné une erreur.")
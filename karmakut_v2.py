@@ -1,25 +1,27 @@
 import os
+import re
 import sys
 import subprocess
-import shutil
-import math
 import time
-from datetime import timedelta
+from collections import deque
 import colorama
 from colorama import Fore, Style, Back
-from pydub import AudioSegment
-from faster_whisper import WhisperModel
+
+# Helpers partagés avec le moteur du GUI (une seule implémentation)
+import reel_maker as rm
 
 # Init Colorama
 colorama.init(autoreset=True)
 
 # Cores Config
 class Config:
-    INPUT_DIR = os.path.abspath("input")
-    OUTPUT_DIR = os.path.abspath("output")
-    TEMP_DIR = os.path.abspath("temp")
-    ASSETS_DIR = os.path.abspath("assets")
+    # Mêmes dossiers que le moteur (résolus et créés une fois par reel_maker)
+    INPUT_DIR = rm.CONFIG["INPUT_DIR"]
+    OUTPUT_DIR = rm.CONFIG["OUTPUT_DIR"]
+    TEMP_DIR = rm.CONFIG["TEMP_DIR"]
+    ASSETS_DIR = rm.CONFIG["ASSETS_DIR"]
     FONT_PATH = os.path.join(ASSETS_DIR, "Poppins-Bold.ttf")
+    VIDEO_EXTS = rm.VIDEO_EXTS
     
     # Silence Detection
     SILENCE_THRESH = -40  # dB (Lower = keep more quiet sounds)
@@ -47,20 +49,39 @@ def check_ffmpeg():
     """Vérifie si FFmpeg est installé et accessible."""
     print(Display.info("Vérification de FFmpeg..."))
     try:
-        subprocess.run(["ffmpeg", "-version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        subprocess.run(["ffmpeg", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         print(Display.success("FFmpeg détecté."))
     except (subprocess.CalledProcessError, FileNotFoundError):
         print(Display.error("CRITIQUE : FFmpeg n'est pas détecté dans le PATH."))
         sys.exit(1)
 
+PIPE_BUFSIZE = 1 << 20  # 1 Mio : tampon de lecture des pipes FFmpeg
+
+def run_ffmpeg(cmd, tail_lines=64):
+    """
+    Lance FFmpeg en lisant stderr au fil de l'eau (pas de log complet en
+    mémoire, pas de blocage sur un pipe plein). Retourne (code, fin du log).
+    """
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          bufsize=PIPE_BUFSIZE,
+                          text=True, encoding="utf-8", errors="replace") as p:
+        for line in p.stderr:
+            tail.append(line)
+    return p.returncode, "".join(tail)
+
 def format_timestamp_srt(seconds):
-    """Convertit des secondes en format SRT (HH:MM:SS,mmm)."""
-    td = timedelta(seconds=seconds)
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    millis = int(td.microseconds / 1000)
+    """Convertit des secondes en format SRT (HH:MM:SS,mmm).
+
+    Volontairement distinct de reel_maker.format_timestamp_srt : les
+    millisecondes sont tronquées (comportement timedelta historique de
+    karmakut), pas arrondies.
+    """
+    # Arithmétique entière (même arrondi à la µs que timedelta, sans l'objet)
+    total_ms = int(round(seconds * 1_000_000)) // 1000
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
     return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
 
 def format_timestamp_ffmpeg(seconds):
@@ -68,80 +89,112 @@ def format_timestamp_ffmpeg(seconds):
     return f"{seconds:.3f}"
 
 class Display:
+    # Préfixes couleur construits une fois (pas de concaténation Fore/Style par appel)
+    _TITLE   = f"{Fore.CYAN}{Style.BRIGHT}\n=== "
+    _TITLE_END = f" ==={Style.RESET_ALL}"
+    _STEP    = f"{Fore.YELLOW}>> "
+    _SUCCESS = f"{Fore.GREEN}[OK] "
+    _ERROR   = f"{Fore.RED}[ERREUR] "
+    _INFO    = f"{Fore.BLUE}[INFO] "
+    _RESET   = Style.RESET_ALL
+
     @staticmethod
     def title(text):
-        return f"{Fore.CYAN}{Style.BRIGHT}\n=== {text} ==={Style.RESET_ALL}"
+        return Display._TITLE + text + Display._TITLE_END
     
     @staticmethod
     def step(text):
-        return f"{Fore.YELLOW}>> {text}{Style.RESET_ALL}"
+        return Display._STEP + text + Display._RESET
     
     @staticmethod
     def success(text):
-        return f"{Fore.GREEN}[OK] {text}{Style.RESET_ALL}"
+        return Display._SUCCESS + text + Display._RESET
     
     @staticmethod
     def error(text):
-        return f"{Fore.RED}[ERREUR] {text}{Style.RESET_ALL}"
+        return Display._ERROR + text + Display._RESET
     
     @staticmethod
     def info(text):
-        return f"{Fore.BLUE}[INFO] {text}{Style.RESET_ALL}"
+        return Display._INFO + text + Display._RESET
 
 def get_input_video():
-    if not os.path.exists(Config.INPUT_DIR):
-        os.makedirs(Config.INPUT_DIR)
-    files = [f for f in os.listdir(Config.INPUT_DIR) if f.lower().endswith(('.mp4', '.mov', '.mkv'))]
+    rm.ensure_dir(Config.INPUT_DIR)
+    files = rm.list_videos(Config.INPUT_DIR)
     if not files:
         print(Display.error(f"Aucune vidéo trouvée dans {Config.INPUT_DIR}"))
         sys.exit(1)
     return os.path.join(Config.INPUT_DIR, files[0])
 
-def analyze_audio_pydub(video_path):
-    print(Display.step(" Extraction de l'audio pour analyse..."))
-    temp_audio = os.path.join(Config.TEMP_DIR, "analysis_audio.wav")
-    
-    # Extract audio purely
-    subprocess.run([
-        "ffmpeg", "-y", "-i", video_path, 
-        "-vn", "-acodec", "pcm_s16le", "-ar", "44100", "-ac", "2",
-        temp_audio
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-    
-    print(Display.step(" Analyse du volume (Pydub)..."))
-    audio = AudioSegment.from_wav(temp_audio)
-    
-    from pydub.silence import detect_nonsilent
-    input_len_ms = len(audio)
-    
-    nonsilent_ranges = detect_nonsilent(
-        audio,
-        min_silence_len=Config.MIN_SILENCE_LEN,
-        silence_thresh=Config.SILENCE_THRESH,
-        seek_step=50
-    )
+# Sortie stderr de silencedetect / en-tête FFmpeg (compilées une fois)
+_RE_SILENCE  = re.compile(r"silence_(start|end): (-?[\d.]+)")
+_RE_DURATION = re.compile(r"Duration: (\d+):(\d+):([\d.]+)")
+
+# Échappement des chemins (une seule passe str.translate)
+_FILTER_PATH_TRANS = str.maketrans({"\\": "/", ":": "\\:"})     # filtre subtitles
+_CONCAT_PATH_TRANS = str.maketrans({"\\": "/", "'": "'\\''"})   # ligne file '...'
+
+def analyze_audio_ffmpeg(video_path):
+    """Détection des passages parlés via le filtre FFmpeg silencedetect (sans WAV)."""
+    print(Display.step(" Analyse du volume (FFmpeg silencedetect)..."))
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", "-i", video_path,
+        "-vn", "-af",
+        f"silencedetect=noise={Config.SILENCE_THRESH}dB:d={Config.MIN_SILENCE_LEN / 1000}",
+        "-f", "null", "-"
+    ]
+
+    # stderr lu au fil du décodage : les silences sont inversés en plages
+    # parlées (ms) ligne par ligne, sans garder le log complet en mémoire.
+    input_len_ms = None
+    nonsilent_ranges = []
+    cursor = 0.0
+    tail = deque(maxlen=20)
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          bufsize=PIPE_BUFSIZE,
+                          text=True, encoding="utf-8", errors="replace") as p:
+        for line in p.stderr:
+            ev = _RE_SILENCE.search(line)
+            if ev:
+                t = max(0.0, float(ev.group(2)) * 1000)
+                if ev.group(1) == "start":
+                    if cursor is not None and t > cursor:
+                        nonsilent_ranges.append((cursor, t))
+                    cursor = None
+                else:
+                    cursor = t
+                continue
+            if input_len_ms is None:
+                dur = _RE_DURATION.search(line)
+                if dur:
+                    h, m, sec = dur.groups()
+                    input_len_ms = (int(h) * 3600 + int(m) * 60 + float(sec)) * 1000
+                    continue
+            tail.append(line)
+    if p.returncode != 0:
+        raise subprocess.CalledProcessError(p.returncode, cmd, stderr="".join(tail))
+
+    if input_len_ms is None:
+        print(Display.error("Durée de la vidéo introuvable."))
+        return []
+    if cursor is not None and cursor < input_len_ms:
+        nonsilent_ranges.append((cursor, input_len_ms))
     
     if not nonsilent_ranges:
         print(Display.error("Aucune voix détectée !"))
         return []
 
-    # Merge logic with padding
-    segments_sec = []
-    for start_ms, end_ms in nonsilent_ranges:
-        start = max(0, start_ms - Config.KEEP_PADDING)
-        end = min(input_len_ms, end_ms + Config.KEEP_PADDING)
-        segments_sec.append((start / 1000.0, end / 1000.0))
-    
+    # Padding + fusion des chevauchements en une passe (plages déjà triées)
+    pad = Config.KEEP_PADDING
     merged = []
-    if segments_sec:
-        current_start, current_end = segments_sec[0]
-        for next_start, next_end in segments_sec[1:]:
-            if next_start < current_end:
-                current_end = max(current_end, next_end)
-            else:
-                merged.append((current_start, current_end))
-                current_start, current_end = next_start, next_end
-        merged.append((current_start, current_end))
+    for start_ms, end_ms in nonsilent_ranges:
+        start = max(0, start_ms - pad) / 1000.0
+        end = min(input_len_ms, end_ms + pad) / 1000.0
+        if merged and start < merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
     
     print(Display.success(f"Détecté {len(merged)} segments parlés."))
     return merged
@@ -153,25 +206,27 @@ def create_concat_file(segments, input_video, concat_filepath):
     """
     # FFmpeg concat format requires escaped paths
     # Windows paths need forward slashes and extra escaping
-    file_ref = input_video.replace("\\", "/").replace("'", "'\\''")
-    
+    file_ref = input_video.translate(_CONCAT_PATH_TRANS)
+    
+    lines = ["ffconcat version 1.0\n", "# Generated by KarmaKut\n"]
+    lines.extend(
+        f"file '{file_ref}'\n"
+        f"inpoint {format_timestamp_ffmpeg(start)}\n"
+        f"outpoint {format_timestamp_ffmpeg(end)}\n"
+        for start, end in segments
+    )
+    # Une seule écriture pour tout le fichier
     with open(concat_filepath, "w", encoding="utf-8") as f:
-        f.write("ffconcat version 1.0\n")
-        f.write(f"# Generated by KarmaKut\n")
-        
-        for start, end in segments:
-            f.write(f"file '{file_ref}'\n")
-            f.write(f"inpoint {format_timestamp_ffmpeg(start)}\n")
-            f.write(f"outpoint {format_timestamp_ffmpeg(end)}\n")
+        f.write("".join(lines))
 
 def step1_cut_silence(input_path, output_cut_path):
     print(Display.title("Étape 1 : Silence Remover (FFmpeg Concat Mode)"))
     
-    segments = analyze_audio_pydub(input_path)
+    segments = analyze_audio_ffmpeg(input_path)
     if not segments:
-        print(Display.info("Aucun silence à couper, copie simple..."))
-        shutil.copy(input_path, output_cut_path)
-        return
+        # Rien à couper : la source sert directement aux étapes suivantes (pas de copie)
+        print(Display.info("Aucun silence à couper, source utilisée telle quelle."))
+        return input_path
 
     # Method: Concat Demuxer
     concat_file = os.path.join(Config.TEMP_DIR, "cuts.ffconcat")
@@ -187,7 +242,7 @@ def step1_cut_silence(input_path, output_cut_path):
         "-safe", "0",
         "-segment_time_metadata", "1",
         "-i", concat_file,
-        "-c:v", "libx264", "-preset", "veryfast",
+        *rm.video_codec_args("fast"),   # encodeur GPU si dispo (sondé une fois)
         "-c:a", "aac",
         "-ac", "2",           # Force stereo
         "-ar", "44100",       # Force standard sample rate
@@ -198,62 +253,77 @@ def step1_cut_silence(input_path, output_cut_path):
     ]
     
     # print(" ".join(cmd))
-    try:
-        subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    code, err_tail = run_ffmpeg(cmd)
+    if code == 0:
         print(Display.success("Cut terminé proprement."))
-    except subprocess.CalledProcessError as e:
+        return output_cut_path
+    else:
         print(Display.error("Erreur FFmpeg Concat:"))
-        print(e.stderr.decode(errors='ignore'))
+        print(err_tail)
         sys.exit(1)
 
 def generate_dynamic_srt(segments, srt_path):
     """
     Génère un SRT dynamique (style Reel/TikTok) en groupant par petits blocs de mots.
     """
-    with open(srt_path, "w", encoding="utf-8") as f:
-        idx = 1
-        for segment in segments:
-            # segment.words exists because we used word_timestamps=True
-            words = segment.words
+    entries = []
+    for segment in segments:
+        # segment.words exists because we used word_timestamps=True
+        words = segment.words
+        
+        # On groupe les mots
+        current_group = []
+        current_raw = ""    # texte du groupe, mis à jour mot à mot
+        
+        # Simple greedy grouping
+        for i, word in enumerate(words):
+            current_group.append(word)
+            current_raw += word.word
             
-            # On groupe les mots
-            current_group = []
+            # Check breaks
+            current_text = current_raw.strip()
+            is_full = len(current_group) >= Config.MAX_WORDS_PER_LINE
+            is_long = len(current_text) > Config.MAX_CHARS_PER_LINE
+            is_last = (i == len(words) - 1)
             
-            # Simple greedy grouping
-            for i, word in enumerate(words):
-                current_group.append(word)
-                
-                # Check breaks
-                current_text = "".join([w.word for w in current_group]).strip()
-                is_full = len(current_group) >= Config.MAX_WORDS_PER_LINE
-                is_long = len(current_text) > Config.MAX_CHARS_PER_LINE
-                is_last = (i == len(words) - 1)
-                
-                if is_full or is_long or is_last:
-                    # Flush group
-                    if not current_group: continue
-                    
-                    start_t = current_group[0].start
-                    end_t = current_group[-1].end
-                    text = "".join([w.word for w in current_group]).strip()
-                    
-                    f.write(f"{idx}\n")
-                    f.write(f"{format_timestamp_srt(start_t)} --> {format_timestamp_srt(end_t)}\n")
-                    f.write(f"{text}\n\n")
-                    
-                    idx += 1
-                    current_group = []
+            if is_full or is_long or is_last:
+                # Flush group
+                start_t = current_group[0].start
+                end_t = current_group[-1].end
+                entries.append(
+                    f"{len(entries) + 1}\n"
+                    f"{format_timestamp_srt(start_t)} --> {format_timestamp_srt(end_t)}\n"
+                    f"{current_text}\n\n"
+                )
+                current_group = []
+                current_raw = ""
+
+    # Une seule écriture pour tout le fichier
+    with open(srt_path, "w", encoding="utf-8") as f:
+        f.write("".join(entries))
+
+def detect_device():
+    """GPU CUDA visible par CTranslate2 ? (appel C direct, pas de nvidia-smi)"""
+    try:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:
+        return "cpu"
 
 def step2_transcribe(video_path, srt_path):
     print(Display.title("Étape 2 : Transcription Dynamique (Whisper)"))
     
-    device = "cuda" if subprocess.run("nvidia-smi", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0 else "cpu"
+    device = detect_device()
     print(Display.info(f"Mode: {device.upper()}"))
+    cpu_ct = rm.cpu_compute_type()
+    compute_type = "int8_float16" if device == "cuda" else cpu_ct
     
     try:
-        model = WhisperModel("base", device=device, compute_type="float16" if device=="cuda" else "int8")
+        # Modèle partagé par processus (cache de reel_maker) : aucun
+        # rechargement si step2_transcribe est rappelé, ni pour le repli CPU
+        model = rm.get_whisper_model(device, compute_type, "base")
     except Exception:
-        model = WhisperModel("base", device="cpu", compute_type="int8")
+        model = rm.get_whisper_model("cpu", cpu_ct, "base")
 
     print(Display.step("Transcribing with Word Timestamps..."))
     
@@ -273,7 +343,9 @@ def step2_transcribe(video_path, srt_path):
              if "cublas" in str(e).lower() or "library" in str(e).lower():
                 print(Display.error("\nCrash CUDA pendant la transcription."))
                 print(Display.info("Restart complet sur CPU..."))
-                model = WhisperModel("base", device="cpu", compute_type="int8")
+                # Le modèle CUDA en cache est inutilisable : on l'évince
+                rm.drop_whisper_model(device, compute_type, "base")
+                model = rm.get_whisper_model("cpu", cpu_ct, "base")
                 segments_gen, info = model.transcribe(video_path, beam_size=5, word_timestamps=True)
                 segments = list(segments_gen)
              else:
@@ -282,7 +354,9 @@ def step2_transcribe(video_path, srt_path):
     except RuntimeError as e:
         # Fallback for init errors caught late
         print(Display.info("Fallback CPU global."))
-        model = WhisperModel("base", device="cpu", compute_type="int8")
+        if device == "cuda":
+            rm.drop_whisper_model(device, compute_type, "base")
+        model = rm.get_whisper_model("cpu", cpu_ct, "base")
         segments_gen, _ = model.transcribe(video_path, beam_size=5, word_timestamps=True)
         segments = list(segments_gen)
 
@@ -298,7 +372,7 @@ def step2_transcribe(video_path, srt_path):
 def step3_burn_and_render(input_path, srt_path, final_output):
     print(Display.title("Étape 3 : Rendu Final 9:16"))
     
-    srt_fixed = srt_path.replace("\\", "/").replace(":", "\\:")
+    srt_fixed = srt_path.translate(_FILTER_PATH_TRANS)
     
     # 1. Crop 9:16 centered
     # 2. Burn subtitles
@@ -308,54 +382,41 @@ def step3_burn_and_render(input_path, srt_path, final_output):
     
     vf_chain = (
         f"crop=ih*(9/16):ih,"
-        f"subtitles='{srt_fixed}':force_style='{Config.SUB_STYLE}'"
+        f"subtitles='{srt_fixed}'{rm.subtitles_fontsdir_opt()}:force_style='{Config.SUB_STYLE}'"
     )
     
-    codec = "libx264"
-    # Check NVENC
-    try:
-        res = subprocess.run(["ffmpeg", "-encoders"], stdout=subprocess.PIPE, text=True)
-        if "h264_nvenc" in res.stdout:
-            codec = "h264_nvenc"
-            print(Display.success("NVENC Activé 🚀"))
-    except: pass
+    codec_args = rm.video_codec_args("final")
+    if codec_args[1] != "libx264":
+        print(Display.success(f"Encodeur matériel : {codec_args[1]} 🚀"))
     
     cmd = [
         "ffmpeg", "-y",
         "-i", input_path,
         "-vf", vf_chain,
-        "-c:v", codec,
+        *codec_args,
         # Settings for quality/compatibility
-        "-pix_fmt", "yuv420p", 
+        "-pix_fmt", "yuv420p",
+        "-c:a", "aac", "-b:a", "192k", final_output,
     ]
     
-    if codec == "libx264":
-        cmd.extend(["-preset", "slow", "-crf", "21"])
-    else:
-        cmd.extend(["-preset", "p4", "-rc", "vbr", "-cq", "22", "-b:v", "5M"])
-        
-    cmd.extend(["-c:a", "aac", "-b:a", "192k", final_output])
-    
     print(Display.step("Rendu en cours..."))
     t0 = time.time()
     
-    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True) as p:
-        for line in p.stdout:
-            pass # Keep it clean or print dots
-            # if "frame=" in line: print(f"\r{line.strip()}", end="")
+    code, err_tail = run_ffmpeg(cmd)
             
-    if p.returncode == 0:
+    if code == 0:
         print(Display.success(f"TERMINÉ: {final_output} ({time.time()-t0:.1f}s)"))
     else:
         print(Display.error("Erreur Rendu."))
+        print(err_tail)
 
 def main():
     os.system("cls" if os.name == "nt" else "clear")
     print(f"{Back.MAGENTA}{Fore.WHITE}  KARMAKUT V2.1 (STABLE)  {Style.RESET_ALL}")
     
     check_ffmpeg()
-    os.makedirs(Config.TEMP_DIR, exist_ok=True)
-    os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
+    for d in (Config.TEMP_DIR, Config.OUTPUT_DIR):
+        rm.ensure_dir(d)   # déjà vérifiés à l'import de reel_maker : aucun stat ici
     
     input_video = get_input_video()
     print(Display.info(f"Source: {os.path.basename(input_video)}"))
@@ -365,7 +426,7 @@ def main():
     final_video = os.path.join(Config.OUTPUT_DIR, f"KarmaKut_{int(time.time())}.mp4")
     
     # 1. CUT (New Concat Engine)
-    step1_cut_silence(input_video, cut_video)
+    cut_video = step1_cut_silence(input_video, cut_video)
     
     # 2. Transcribe (Dynamic SRT)
     step2_transcribe(cut_video, srt_file)
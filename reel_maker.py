@@ -3,14 +3,22 @@ reel_maker.py — Moteur de traitement vidéo (FFmpeg pur, zéro moviepy)
 Toutes les opérations vidéo passent par des sous-processus ffmpeg/ffprobe.
 Aucun DLL hack, aucun chemin codé en dur.
 """
+import hashlib
+import json
 import os
+import shutil
+import struct
 import subprocess
-from datetime import timedelta
-
+import threading
+import time
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 from dotenv import load_dotenv
 from colorama import init, Fore, Style
-from pydub import AudioSegment
-from pydub import silence as pydub_silence
 
 init(autoreset=True)
 load_dotenv()
@@ -18,21 +26,35 @@ load_dotenv()
 # ── Windows: pas de fenêtre console lors des appels ffmpeg ───────────────────
 _CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
 
+# Arguments communs à tous les sous-processus, construits une seule fois
+SPAWN_KW = {"creationflags": _CREATIONFLAGS}
+if os.name == "nt":
+    _si = subprocess.STARTUPINFO()
+    _si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _si.wShowWindow = subprocess.SW_HIDE
+    SPAWN_KW["startupinfo"] = _si
+
 # ==================================================================================
 # 1. CONFIGURATION
 # ==================================================================================
+_BASE_DIR = os.getcwd()   # un seul getcwd pour tous les dossiers de travail
+
 CONFIG = {
-    "INPUT_DIR":  os.path.abspath("input"),
-    "OUTPUT_DIR": os.path.abspath("output"),
-    "ASSETS_DIR": os.path.abspath("assets"),
-    "TEMP_DIR":   os.path.abspath("temp"),
+    "INPUT_DIR":  os.path.join(_BASE_DIR, "input"),
+    "OUTPUT_DIR": os.path.join(_BASE_DIR, "output"),
+    "ASSETS_DIR": os.path.join(_BASE_DIR, "assets"),
+    "TEMP_DIR":   os.path.join(_BASE_DIR, "temp"),
     # Détection des silences
     "SILENCE_THRESH":    -54,   # dB (valeur basse = uniquement vrais silences)
     "MIN_SILENCE_LEN":   500,   # ms
+    "MIN_KEEP_MS":       100,   # ms : segment gardé plus court = fusionné dans les coupes
     # Whisper
     "WHISPER_MODEL_SIZE": "small",
-    "COMPUTE_TYPE": "float16",
+    "COMPUTE_TYPE": "int8_float16",   # GPU : poids int8, activations fp16 (~moitié de VRAM)
     "DEVICE":       "cuda",
+    "WHISPER_VAD":  True,     # VAD Silero intégré : les silences restants ne passent pas dans Whisper
+    "WHISPER_BATCH_SIZE": 16, # GPU : fenêtres de 30 s encodées par lot (0 = mode séquentiel)
+    "WORD_TIMESTAMPS": True,  # False : pas d'alignement DTW par mot, timing interpolé (plus rapide)
     # Sous-titres (style ASS compatible FFmpeg)
     "SUB_STYLE": (
         "Fontname=Poppins,"
@@ -45,10 +67,57 @@ CONFIG = {
         "MarginV={margin_v}"        # Dynamique
     ),
     "MAX_WORDS_PER_SUB": 5,         # Limité à ~1 ligne
+    # Assemblage : nombre d'encodeurs FFmpeg en parallèle (1 = une seule passe, 0 = auto)
+    "ASSEMBLY_WORKERS": 1,
+    # Jusqu'à ce nombre de segments : découpe trim/atrim en un seul décodage
+    # (au-delà, ou à 0 : Concat Demuxer)
+    "TRIM_FILTER_MAX_SEGMENTS": 40,
+    # Assemblage sans ré-encodage (copie des flux) : quasi instantané mais
+    # chaque coupe démarre sur l'image clé précédente (≤ 1 s sur la copie CFR)
+    "ASSEMBLY_STREAM_COPY": False,
+    # FFmpeg tué si aucune ligne de progression pendant ce délai (s, 0 = jamais)
+    "FFMPEG_STALL_TIMEOUT": 120,
 }
 
+_DIRS_READY = set()   # dossiers déjà vérifiés/créés dans ce processus
+
+
+def ensure_dir(path: str) -> str:
+    """Crée `path` au besoin ; un seul stat par dossier et par processus."""
+    if path not in _DIRS_READY:
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        _DIRS_READY.add(path)
+    return path
+
+
 for d in [CONFIG["INPUT_DIR"], CONFIG["OUTPUT_DIR"], CONFIG["ASSETS_DIR"], CONFIG["TEMP_DIR"]]:
-    os.makedirs(d, exist_ok=True)
+    ensure_dir(d)
+
+# Audio Whisper (mono 16 kHz) produit par assemble_clips et relu par transcribe
+CUT_AUDIO_PATH = os.path.join(CONFIG["TEMP_DIR"], "cut_audio.wav")
+
+# Extensions vidéo acceptées (comparées en minuscules)
+VIDEO_EXTS = (".mp4", ".mov", ".mkv")
+
+# Lignes de stderr FFmpeg conservées pour les messages d'erreur
+_STDERR_TAIL_LINES = 40
+
+# Tampon de lecture des pipes FFmpeg (1 Mio) : moins d'appels read() côté Python
+_PIPE_BUFSIZE = 1 << 20
+
+# Threads par encodage FFmpeg (0 = FFmpeg décide, tous les cœurs).
+# Fixé par analyze_many dans chaque processus fils : N encodages à 4 threads
+# débitent plus qu'un seul encodage qui se partage toute la machine.
+_FFMPEG_THREADS = 0
+
+# WAV d'analyse : mono 16 kHz suffit à l'enveloppe RMS (11× moins d'octets
+# que du stéréo 44.1 kHz) et à la waveform du GUI
+_ANALYSIS_AUDIO_ARGS = ("-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1")
+
+# Échappement pour les filtres FFmpeg (une seule passe str.translate)
+_FFMPEG_PATH_TRANS = str.maketrans({"\\": "/", ":": "\\:"})
+_FFMPEG_TEXT_TRANS = str.maketrans({"'": "\\'", ":": "\\:"})
 
 
 # ==================================================================================
@@ -65,27 +134,341 @@ def print_warn(msg):
     print(f"{Fore.YELLOW}  ⚠ {msg}")
 
 
+def list_videos(folder: str) -> list:
+    """Noms triés des vidéos de `folder` — un seul passage scandir, casse ignorée."""
+    if not os.path.isdir(folder):
+        return []
+    with os.scandir(folder) as it:
+        return sorted(e.name for e in it
+                      if e.is_file() and e.name.lower().endswith(VIDEO_EXTS))
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> str:
+    """Chemin complet de `name` (ffmpeg, ffprobe) résolu une seule fois dans le PATH.
+
+    Si introuvable, renvoie `name` tel quel : le lancement lèvera alors
+    FileNotFoundError comme avant.
+    """
+    return shutil.which(name) or name
+
+
+# Encodeurs H.264 matériels, par ordre de préférence
+_HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_amf")
+
+# Réglages qualité par encodeur : "final" (export) / "fast" (assemblage) /
+# "intermediate" (copie CFR de travail, quasi sans perte)
+_ENCODER_ARGS = {
+    "h264_nvenc": {
+        "final": ["-preset", "p5", "-tune", "hq", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+        "fast":  ["-preset", "p2", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+        "intermediate": ["-preset", "p2", "-rc", "vbr", "-cq", "19", "-b:v", "0"],
+    },
+    "h264_qsv": {
+        "final": ["-preset", "slow", "-global_quality", "23"],
+        "fast":  ["-preset", "veryfast", "-global_quality", "23"],
+        "intermediate": ["-preset", "veryfast", "-global_quality", "19"],
+    },
+    "h264_videotoolbox": {
+        "final": ["-q:v", "65"],
+        "fast":  ["-q:v", "60", "-realtime", "1"],
+        "intermediate": ["-q:v", "75", "-realtime", "1"],
+    },
+    "h264_amf": {
+        "final": ["-quality", "quality", "-rc", "cqp", "-qp_i", "23", "-qp_p", "23"],
+        "fast":  ["-quality", "speed", "-rc", "cqp", "-qp_i", "23", "-qp_p", "23"],
+        "intermediate": ["-quality", "speed", "-rc", "cqp", "-qp_i", "19", "-qp_p", "19"],
+    },
+    "libx264": {
+        "final": ["-preset", "slow", "-crf", "21"],
+        "fast":  ["-preset", "veryfast"],
+        "intermediate": ["-preset", "ultrafast", "-crf", "18"],
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder() -> str:
+    """Premier encodeur H.264 matériel utilisable, sinon "libx264".
+
+    `ffmpeg -encoders` liste aussi les encodeurs compilés sans GPU derrière :
+    chaque candidat est validé par un encodage d'une image. Résultat mis en
+    cache pour tout le processus.
+    """
+    ffmpeg = find_executable("ffmpeg")
+    try:
+        res = subprocess.run([ffmpeg, "-hide_banner", "-encoders"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             **SPAWN_KW)
+    except Exception:
+        return "libx264"
+    for enc in _HW_ENCODERS:
+        if enc.encode() not in res.stdout:
+            continue
+        try:
+            test = subprocess.run(
+                [ffmpeg, "-hide_banner", "-loglevel", "error",
+                 "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                 "-frames:v", "1", "-c:v", enc, "-f", "null", "-"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=15, **SPAWN_KW,
+            )
+        except Exception:
+            continue
+        if test.returncode == 0:
+            return enc
+    return "libx264"
+
+
+def video_codec_args(quality: str = "final") -> list:
+    """Arguments `-c:v ...` pour l'encodeur détecté ("final", "fast" ou "intermediate")."""
+    enc = detect_hw_encoder()
+    return ["-c:v", enc] + _ENCODER_ARGS[enc][quality]
+
+
 class VideoDuration:
     """Wrapper minimal pour fournir l'attribut .duration sans moviepy."""
     def __init__(self, duration_seconds: float):
         self.duration = duration_seconds
 
 
-def get_video_duration(video_path: str) -> float:
-    """Retourne la durée en secondes via ffprobe."""
+def _analysis_paths(video_path: str):
+    """Fichiers temporaires (CFR, WAV) propres à une vidéo source.
+
+    Nommés d'après la source + empreinte de son chemin absolu : clip.mp4 et
+    clip.mov analysés en parallèle ne s'écrasent pas.
+    """
+    root = os.path.splitext(os.path.basename(video_path))[0]
+    h8 = hashlib.blake2b(os.path.abspath(video_path).encode(), digest_size=4).hexdigest()
+    return (os.path.join(CONFIG["TEMP_DIR"], f"temp_cfr_{root}_{h8}.mp4"),
+            os.path.join(CONFIG["TEMP_DIR"], f"temp_audio_{root}_{h8}.wav"))
+
+
+def analysis_audio_path(video_path: str) -> str:
+    """WAV extrait par extract_and_detect_silences pour `video_path`."""
+    return _analysis_paths(video_path)[1]
+
+
+def _silence_cache_path(video_path: str, thresh: int, min_len: int) -> str:
+    """Fichier cache JSON de l'analyse, clé = (chemin, taille, mtime, réglages)."""
+    st = os.stat(video_path)
+    raw = (f"{os.path.abspath(video_path)}:{st.st_size}:{st.st_mtime_ns}:{thresh}:{min_len}"
+           f":{'-'.join(_ANALYSIS_AUDIO_ARGS)}")
+    key = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return os.path.join(CONFIG["TEMP_DIR"], f"silence_{key}.json")
+
+
+def _file_sig(path: str):
+    """[taille, mtime_ns] d'un fichier (None s'il n'existe pas)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+_PROBE_CACHE = OrderedDict()   # chemin absolu → ((taille, mtime_ns), infos ffprobe), ordre LRU
+_PROBE_CACHE_MAX  = 256
+_PROBE_CACHE_LOCK = threading.Lock()   # probe_many remplit le cache depuis plusieurs threads
+
+
+def _probe_cache_put(path: str, sig: tuple, info: dict):
+    """Mémorise un résultat ffprobe ; évince le plus ancien au-delà de _PROBE_CACHE_MAX."""
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE[path] = (sig, info)
+        _PROBE_CACHE.move_to_end(path)
+        while len(_PROBE_CACHE) > _PROBE_CACHE_MAX:
+            _PROBE_CACHE.popitem(last=False)
+
+
+def probe_media(video_path: str) -> dict:
+    """
+    Format et flux d'un fichier en un seul appel ffprobe (sortie JSON).
+
+    Le résultat est mémorisé par (chemin, taille, mtime) : les appels
+    suivants sur un fichier inchangé ne relancent pas ffprobe.
+    Retourne {} si ffprobe échoue.
+    """
+    path = os.path.abspath(video_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    sig = (st.st_size, st.st_mtime_ns)
+    with _PROBE_CACHE_LOCK:
+        cached = _PROBE_CACHE.get(path)
+        if cached and cached[0] == sig:
+            _PROBE_CACHE.move_to_end(path)
+            return cached[1]
     try:
         result = subprocess.run(
-            ["ffprobe", "-v", "quiet",
-             "-show_entries", "format=duration",
-             "-of", "default=noprint_wrappers=1:nokey=1",
-             video_path],
+            [find_executable("ffprobe"), "-v", "quiet",
+             "-print_format", "json", "-show_format", "-show_streams",
+             path],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            creationflags=_CREATIONFLAGS,
+            stderr=subprocess.DEVNULL,
+            **SPAWN_KW,
             timeout=30,
         )
-        return float(result.stdout.strip())
+        info = json.loads(result.stdout or b"{}")
     except Exception:
+        return {}
+    if info:
+        _probe_cache_put(path, sig, info)
+    return info
+
+
+_DURATION_CACHE = {}   # chemin absolu → ((taille, mtime_ns), durée s) des fichiers produits
+
+
+# Copies CFR ré-encodées avec une image clé par seconde (-g 30) :
+# chemin absolu → [taille, mtime_ns]. Seuls ces fichiers peuvent être
+# assemblés en copie de flux (cf. _can_stream_copy).
+_GOP_1S_FILES = {}
+
+
+def _mark_gop_1s(path: str):
+    """Enregistre `path` comme copie CFR produite avec -g 30."""
+    sig = _file_sig(path)
+    if sig is not None:
+        _GOP_1S_FILES[os.path.abspath(path)] = sig
+
+
+def _has_gop_1s(path: str) -> bool:
+    """Vrai si `path` est une copie CFR -g 30 et n'a pas changé depuis."""
+    sig = _GOP_1S_FILES.get(os.path.abspath(path))
+    return sig is not None and sig == _file_sig(path)
+
+
+def _remember_duration(path: str, duration_s: float):
+    """
+    Mémorise la durée d'un fichier que l'on vient de produire (connue sans
+    ffprobe) : get_video_duration ne relance pas de sonde dessus. Seule la
+    durée est retenue ; probe_media reste un vrai résultat ffprobe.
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    _DURATION_CACHE[path] = ((st.st_size, st.st_mtime_ns), duration_s)
+
+
+def probe_many(paths: list, max_workers: int = 8) -> dict:
+    """
+    Sonde plusieurs fichiers en parallèle (ffprobe n'accepte qu'une entrée
+    par appel) et remplit le cache de probe_media. Retourne {chemin: info}.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return {p: probe_media(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return dict(zip(paths, pool.map(probe_media, paths)))
+
+
+def _frame_rate(rate: str) -> float:
+    """"30000/1001" → 29.97 (0.0 si illisible)."""
+    try:
+        num, _, den = rate.partition("/")
+        return float(num) / float(den or 1)
+    except (AttributeError, ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _is_cfr_video(video_path: str) -> bool:
+    """Vrai si le premier flux vidéo est du H.264 à 30 fps constant
+    (r_frame_rate == avg_frame_rate)."""
+    for stream in probe_media(video_path).get("streams", ()):
+        if stream.get("codec_type") == "video":
+            r_fps   = _frame_rate(stream.get("r_frame_rate", ""))
+            avg_fps = _frame_rate(stream.get("avg_frame_rate", ""))
+            return (stream.get("codec_name") == "h264"
+                    and abs(r_fps - 30.0) < 0.01
+                    and abs(avg_fps - r_fps) < 0.01)
+    return False
+
+
+def _is_cfr_conformant(video_path: str) -> bool:
+    """
+    Vrai si la source peut servir telle quelle de working_path : H.264 à
+    30 fps constant avec de l'audio AAC.
+    """
+    return _is_cfr_video(video_path) and _audio_codec(video_path) == "aac"
+
+
+def _audio_codec(video_path: str) -> str:
+    """Codec du premier flux audio ("" si absent ou inconnu)."""
+    for stream in probe_media(video_path).get("streams", ()):
+        if stream.get("codec_type") == "audio":
+            return stream.get("codec_name", "")
+    return ""
+
+
+_MP4_EXTS = (".mp4", ".mov", ".m4v", ".m4a")
+
+
+def _mp4_duration(path: str) -> float:
+    """
+    Durée lue directement dans l'atome moov/mvhd d'un MP4/MOV (quelques
+    seek + lectures de 8 octets, pas de processus ffprobe). 0.0 si introuvable.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            pos = 0
+            while pos + 8 <= end:
+                f.seek(pos)
+                size, kind = struct.unpack(">I4s", f.read(8))
+                header = 8
+                if size == 1:                       # taille 64 bits
+                    size = struct.unpack(">Q", f.read(8))[0]
+                    header = 16
+                elif size == 0:                     # jusqu'à la fin du fichier
+                    size = end - pos
+                if size < header:
+                    return 0.0
+                if kind == b"moov":
+                    end = pos + size                # on descend dans moov
+                    pos += header
+                    continue
+                if kind == b"mvhd":
+                    version = f.read(4)[0]
+                    if version == 1:
+                        f.seek(16, os.SEEK_CUR)
+                        timescale, duration = struct.unpack(">IQ", f.read(12))
+                    else:
+                        f.seek(8, os.SEEK_CUR)
+                        timescale, duration = struct.unpack(">II", f.read(8))
+                    return duration / timescale if timescale else 0.0
+                pos += size
+    except (OSError, struct.error, IndexError):
+        pass
+    return 0.0
+
+
+def get_video_duration(video_path: str) -> float:
+    """
+    Retourne la durée en secondes : durée mémorisée pour les fichiers
+    produits par le moteur, atome mvhd pour les MP4/MOV, sinon ffprobe
+    (voir probe_media).
+    """
+    path = os.path.abspath(video_path)
+    known = _DURATION_CACHE.get(path)
+    if known:
+        try:
+            st = os.stat(path)
+            if known[0] == (st.st_size, st.st_mtime_ns):
+                return known[1]
+        except OSError:
+            pass
+    if video_path.lower().endswith(_MP4_EXTS):
+        duration = _mp4_duration(video_path)
+        if duration > 0:
+            return duration
+    try:
+        return float(probe_media(video_path)["format"]["duration"])
+    except (KeyError, TypeError, ValueError):
         return 0.0
 
 
@@ -100,24 +483,97 @@ def format_timestamp_srt(seconds: float) -> str:
     return f"{h:02}:{m:02}:{s:02},{ms:03}"
 
 
-def _run_ffmpeg(cmd: list, msg: str = "FFmpeg en cours...") -> subprocess.CompletedProcess:
-    """Lance une commande FFmpeg sans ouvrir de console Windows."""
+def _drain_stderr(stream, tail: deque):
+    """Lit stderr ligne à ligne en ne gardant que la fin (message d'erreur)."""
+    for line in stream:
+        tail.append(line)
+
+
+def _run_ffmpeg(cmd: list, msg: str = "FFmpeg en cours...",
+                progress_callback=None, duration: float = 0.0) -> subprocess.CompletedProcess:
+    """
+    Lance une commande FFmpeg sans ouvrir de console Windows.
+
+    stderr est consommé au fil de l'eau et seules ses dernières lignes sont
+    conservées pour le message d'erreur (pas de log complet en mémoire).
+
+    Si `progress_callback` et `duration` (secondes de média produit) sont
+    fournis, FFmpeg est lancé avec `-progress pipe:1` et
+    progress_callback(fraction 0.0-1.0) est appelé au fil de l'encodage.
+    Dans ce mode, un processus qui n'émet plus rien pendant
+    CONFIG["FFMPEG_STALL_TIMEOUT"] secondes est tué (RuntimeError).
+    """
+    with_progress = progress_callback is not None and duration > 0
+    exe = [find_executable(cmd[0])]
+    if with_progress:
+        exe += ["-progress", "pipe:1", "-nostats"]
+    cmd = exe + list(cmd[1:])
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.PIPE if with_progress else subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            creationflags=_CREATIONFLAGS,
+            bufsize=_PIPE_BUFSIZE,
+            **SPAWN_KW,
         )
-        if result.returncode != 0:
-            err = result.stderr.decode(errors="replace")
-            raise RuntimeError(f"FFmpeg erreur (code {result.returncode}):\n{err[-1500:]}")
-        return result
     except FileNotFoundError:
         raise RuntimeError(
             "FFmpeg introuvable. Installez FFmpeg et ajoutez-le au PATH système."
         )
 
+    err_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    if not with_progress:
+        _drain_stderr(proc.stderr, err_tail)
+    else:
+        # stderr lu en parallèle : sinon le pipe plein bloquerait FFmpeg
+        reader = threading.Thread(target=_drain_stderr, args=(proc.stderr, err_tail),
+                                  daemon=True)
+        reader.start()
+
+        # Chien de garde : FFmpeg écrit un bloc de progression toutes les ~0.5 s
+        stall_timeout = CONFIG.get("FFMPEG_STALL_TIMEOUT") or 0
+        last_seen = [time.monotonic()]
+        done, stalled = threading.Event(), threading.Event()
+
+        def _watchdog():
+            while not done.wait(min(5.0, stall_timeout)):
+                if time.monotonic() - last_seen[0] > stall_timeout:
+                    stalled.set()
+                    proc.kill()
+                    return
+
+        if stall_timeout > 0:
+            threading.Thread(target=_watchdog, daemon=True).start()
+
+        total_us = duration * 1_000_000
+        last = -1.0
+        for line in proc.stdout:
+            last_seen[0] = time.monotonic()
+            # out_time_ms est aussi exprimé en µs (nom historique de FFmpeg)
+            if line.startswith((b"out_time_us=", b"out_time_ms=")):
+                try:
+                    us = int(line.split(b"=", 1)[1])
+                except ValueError:
+                    continue        # "N/A" en début d'encodage
+                frac = min(1.0, us / total_us)
+                if frac - last >= 0.01:
+                    last = frac
+                    progress_callback(frac)
+        done.set()
+        reader.join()
+    proc.wait()
+
+    if with_progress and stalled.is_set():
+        raise RuntimeError(
+            f"FFmpeg bloqué : aucune progression depuis {stall_timeout} s, processus arrêté."
+        )
+
+    err = b"".join(err_tail)
+    if proc.returncode != 0:
+        err_txt = err.decode(errors="replace")
+        raise RuntimeError(f"FFmpeg erreur (code {proc.returncode}):\n{err_txt[-1500:]}")
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, err)
+
 
 def _write_srt_grouped(words_data: list, srt_path: str, max_words: int = None):
     """
@@ -125,34 +581,132 @@ def _write_srt_grouped(words_data: list, srt_path: str, max_words: int = None):
     Ex. : 4 mots max par sous-titre.
     """
     max_w = max_words or CONFIG.get("MAX_WORDS_PER_SUB", 4)
+    entries = []
+    for i in range(0, len(words_data), max_w):
+        group = words_data[i: i + max_w]
+        text  = " ".join(w["word"] for w in group).strip()
+        if text:
+            entries.append(
+                f"{len(entries) + 1}\n"
+                f"{format_timestamp_srt(group[0]['start'])} --> "
+                f"{format_timestamp_srt(group[-1]['end'])}\n"
+                f"{text}\n\n"
+            )
     with open(srt_path, "w", encoding="utf-8") as f:
-        idx = 1
-        i = 0
-        while i < len(words_data):
-            group = words_data[i: i + max_w]
-            if not group:
-                break
-            start_t = group[0]["start"]
-            end_t   = group[-1]["end"]
-            text    = " ".join(w["word"] for w in group).strip()
-            if text:
-                f.write(f"{idx}\n")
-                f.write(f"{format_timestamp_srt(start_t)} --> {format_timestamp_srt(end_t)}\n")
-                f.write(f"{text}\n\n")
-                idx += 1
-            i += max_w
+        f.write("".join(entries))     # une seule écriture pour tout le fichier
 
 
 # ==================================================================================
 # 3. PHASE 1a — EXTRACTION AUDIO & DÉTECTION DES SILENCES
 # ==================================================================================
 
+_WAV_DTYPES = {2: np.int16, 4: np.int32}   # largeur d'échantillon → dtype numpy
+
+
+def _wav_ms_energy(wav_path: str):
+    """
+    Lit un WAV PCM par blocs et retourne l'énergie cumulée par milliseconde.
+
+    Retourne (cs, bounds, channels, max_amplitude, length_ms) où
+    cs[k] = somme des carrés des échantillons avant la ms k et
+    bounds[k] = index de frame de la ms k (même arrondi que pydub).
+    Jamais plus d'un bloc de ~10 s d'échantillons en mémoire.
+    """
+    with wave.open(wav_path, "rb") as wf:
+        channels = wf.getnchannels()
+        width    = wf.getsampwidth()
+        rate     = wf.getframerate()
+        n_frames = wf.getnframes()
+        dtype = _WAV_DTYPES.get(width)
+        if dtype is None:
+            raise RuntimeError(f"WAV non supporté ({8 * width} bits) : {wav_path}")
+
+        length_ms = int(round(1000 * n_frames / rate))
+        bounds = (np.arange(length_ms + 1) * rate / 1000.0).astype(np.int64)
+        frame_at = np.minimum(bounds, n_frames)    # frames au-delà de la fin = silence
+        cs = np.zeros(length_ms + 1, dtype=np.int64)
+
+        block_ms = 10_000
+        total = 0
+        for k0 in range(0, length_ms, block_ms):
+            k1 = min(k0 + block_ms, length_ms)
+            f0, f1 = frame_at[k0], frame_at[k1]
+            data = np.frombuffer(wf.readframes(int(f1 - f0)), dtype=dtype)
+            sq = np.square(data.astype(np.int64)).reshape(-1, channels).sum(axis=1)
+            block_cs = np.concatenate(([0], np.cumsum(sq)))
+            cs[k0 + 1:k1 + 1] = total + block_cs[frame_at[k0 + 1:k1 + 1] - f0]
+            total += int(block_cs[-1])
+
+    max_amplitude = float(1 << (8 * width - 1))
+    return cs, bounds, channels, max_amplitude, length_ms
+
+
+def load_waveform(wav_path: str, n_points: int = 4000) -> np.ndarray:
+    """
+    Enveloppe d'affichage d'un WAV PCM : pic absolu (canaux moyennés) de
+    chaque tranche, normalisé sur 0-1. Lecture par blocs, sans pydub.
+    """
+    with wave.open(wav_path, "rb") as wf:
+        channels = wf.getnchannels()
+        n_frames = wf.getnframes()
+        dtype = _WAV_DTYPES.get(wf.getsampwidth())
+        if dtype is None:
+            raise RuntimeError(f"WAV non supporté ({8 * wf.getsampwidth()} bits) : {wav_path}")
+
+        def _read(n):
+            data = np.frombuffer(wf.readframes(n), dtype=dtype).astype(np.float32)
+            return data.reshape(-1, channels).mean(axis=1) if channels > 1 else data
+
+        if n_frames <= n_points:
+            peaks = np.abs(_read(n_frames))
+        else:
+            step = n_frames // n_points
+            peaks = np.empty(n_points, dtype=np.float32)
+            per_block = max(1, (1 << 20) // step)      # ~1 M frames par lecture
+            for b0 in range(0, n_points, per_block):
+                nb = min(per_block, n_points - b0)
+                peaks[b0:b0 + nb] = np.abs(_read(nb * step).reshape(nb, step)).max(axis=1)
+
+    peak = peaks.max() if len(peaks) else 0.0
+    if peak > 0:
+        peaks = peaks / peak
+    return peaks
+
+
+def detect_silence_wav(wav_path: str, min_silence_len: int, silence_thresh: float) -> list:
+    """
+    Détection des silences vectorisée (numpy), mêmes résultats que
+    pydub.silence.detect_silence(seek_step=1) sans fenêtre glissante en Python.
+
+    Retourne list of [start_ms, end_ms].
+    """
+    cs, bounds, channels, max_amp, length_ms = _wav_ms_energy(wav_path)
+    if length_ms < min_silence_len:
+        return []
+
+    # RMS de chaque fenêtre [i, i + min_silence_len) pour tous les i à la fois
+    starts = np.arange(length_ms - min_silence_len + 1)
+    ends   = starts + min_silence_len
+    energy = (cs[ends] - cs[starts]).astype(np.float64)
+    n_samples = (bounds[ends] - bounds[starts]) * channels
+    rms = np.floor(np.sqrt(energy / n_samples))
+    silent = np.flatnonzero(rms <= 10 ** (silence_thresh / 20) * max_amp)
+    if len(silent) == 0:
+        return []
+
+    # Fenêtres silencieuses qui se chevauchent → une seule plage
+    gaps = np.flatnonzero(np.diff(silent) > min_silence_len)
+    range_starts = silent[np.concatenate(([0], gaps + 1))]
+    range_ends   = silent[np.concatenate((gaps, [len(silent) - 1]))] + min_silence_len
+    return [[int(a), int(b)] for a, b in zip(range_starts, range_ends)]
+
+
 def extract_and_detect_silences(video_path: str,
                                  silence_thresh: int = None,
                                  min_silence_len: int = None,
                                  progress_callback=None):
     """
-    Phase 1a : Extraction audio via FFmpeg + détection des silences via pydub.
+    Phase 1a : Extraction audio via FFmpeg + détection des silences (numpy).
 
     Retourne
     --------
@@ -161,7 +715,8 @@ def extract_and_detect_silences(video_path: str,
     silences : list of (start_ms, end_ms)
         Plages de silences détectées.
     working_path : str
-        Chemin vers la vidéo normalisée CFR.
+        Chemin vers la vidéo normalisée CFR (la source elle-même si elle est
+        déjà en H.264/AAC à 30 fps constant).
     """
     thresh  = silence_thresh  if silence_thresh  is not None else CONFIG["SILENCE_THRESH"]
     min_len = min_silence_len if min_silence_len is not None else CONFIG["MIN_SILENCE_LEN"]
@@ -172,49 +727,194 @@ def extract_and_detect_silences(video_path: str,
         else:
             print_info(msg)
 
-    # ── 1. Normalisation CFR (30 fps fixe) ───────────────────────────────────
-    _p(0.0, "Normalisation CFR (30 fps)...")
-    cfr_path = os.path.join(CONFIG["TEMP_DIR"], "temp_cfr.mp4")
+    cfr_path, audio_path = _analysis_paths(video_path)
+
+    # ── 0. Cache : même fichier, mêmes réglages → pas de ré-analyse ──────────
     try:
+        cache_path = _silence_cache_path(video_path, thresh, min_len)
+    except OSError:
+        cache_path = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            # Copie de travail et WAV inchangés depuis l'analyse mise en cache
+            working_sig = _file_sig(cached["working_path"])
+            if (working_sig is not None and working_sig == cached["working_sig"]
+                    and _file_sig(audio_path) == cached["audio_sig"]):
+                if cached.get("gop_1s"):
+                    _mark_gop_1s(cached["working_path"])
+                silences = cached["silences"]
+                _p(1.0, f"{len(silences)} silence(s) détecté(s) (cache).")
+                return VideoDuration(cached["duration"]), silences, cached["working_path"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass    # Cache illisible : on refait l'analyse
+
+    # ── 1. Durée via ffprobe (source) ────────────────────────────────────────
+    # Un seul ffprobe : la passe CFR conserve la durée de la source, elle sert
+    # donc aussi de référence pour la progression et pour la timeline.
+    _p(0.0, "Lecture des métadonnées vidéo...")
+    duration_s = get_video_duration(video_path)
+    video_info = VideoDuration(duration_s)
+
+    # ── 2. Normalisation CFR (30 fps) + audio d'analyse : une seule passe ────
+    # La source n'est décodée qu'une fois : FFmpeg écrit en parallèle la
+    # vidéo CFR et le WAV utilisé pour la détection des silences.
+    if _is_cfr_conformant(video_path):
+        # Source déjà en H.264 30 fps constant + AAC : rien à normaliser
+        _p(0.0, "Source déjà en CFR 30 fps — pas de ré-encodage.")
+        working_path = video_path
+    elif _is_cfr_video(video_path) and _audio_codec(video_path):
+        # Vidéo déjà conforme, seul l'audio (PCM, Opus…) est à convertir :
+        # flux vidéo recopié, l'AAC et le WAV d'analyse sortent du même passage
+        _p(0.0, "Vidéo déjà en CFR 30 fps — conversion de l'audio seul...")
+        cfr_cb = None
+        if progress_callback:
+            cfr_cb = lambda f: _p(0.5 * f, f"Conversion audio... {int(f * 100)}%")
+        try:
+            _run_ffmpeg([
+                "ffmpeg", "-y", "-i", video_path,
+                "-map", "0:v:0", "-map", "0:a:0",
+                "-c:v", "copy",
+                "-c:a", "aac", "-b:a", "192k",
+                cfr_path,
+                "-vn", *_ANALYSIS_AUDIO_ARGS,
+                audio_path,
+            ], progress_callback=cfr_cb, duration=duration_s)
+            working_path = cfr_path if os.path.exists(cfr_path) else video_path
+        except Exception:
+            working_path = video_path   # Fallback : audio seul depuis la source
+        if working_path == cfr_path:
+            _remember_duration(cfr_path, duration_s)
+    else:
+        _p(0.0, "Normalisation CFR (30 fps) + extraction audio...")
+        cfr_cb = None
+        if progress_callback:
+            cfr_cb = lambda f: _p(0.5 * f, f"Normalisation CFR... {int(f * 100)}%")
+        # Encodeur matériel si disponible ; en cas d'échec, une 2e tentative libx264
+        attempts = [video_codec_args("intermediate")]
+        if attempts[0][1] != "libx264":
+            attempts.append(["-c:v", "libx264", *_ENCODER_ARGS["libx264"]["intermediate"]])
+        working_path = video_path   # Fallback : audio seul depuis la source
+        for codec_args in attempts:
+            # NVENC : décodage NVDEC aussi (images recopiées en RAM pour le filtre fps)
+            hwaccel = ["-hwaccel", "cuda"] if codec_args[1] == "h264_nvenc" else []
+            try:
+                _run_ffmpeg([
+                    "ffmpeg", "-y", *hwaccel, "-i", video_path,
+                    *codec_args,
+                    *(["-threads", str(_FFMPEG_THREADS)] if _FFMPEG_THREADS else []),
+                    "-r", "30",
+                    # Une image clé par seconde : chaque inpoint du concat ne
+                    # décode qu'au plus 29 images depuis la clé précédente
+                    "-g", "30", "-keyint_min", "30", "-sc_threshold", "0",
+                    "-c:a", "aac", "-b:a", "192k",
+                    cfr_path,
+                    "-vn", *_ANALYSIS_AUDIO_ARGS,
+                    audio_path,
+                ], progress_callback=cfr_cb, duration=duration_s)
+            except Exception:
+                continue
+            if os.path.exists(cfr_path):
+                working_path = cfr_path
+                _remember_duration(cfr_path, duration_s)
+                _mark_gop_1s(cfr_path)
+            break
+
+    # ── 3. Extraction audio seule (source conforme ou passe combinée échouée) ─
+    if working_path == video_path:
+        _p(0.2, "Extraction de l'audio...")
         _run_ffmpeg([
             "ffmpeg", "-y", "-i", video_path,
-            "-c:v", "libx264", "-crf", "18", "-preset", "ultrafast",
-            "-r", "30", "-c:a", "aac", "-b:a", "192k",
-            cfr_path,
+            "-vn", *_ANALYSIS_AUDIO_ARGS,
+            audio_path,
         ])
-        working_path = cfr_path if os.path.exists(cfr_path) else video_path
-    except Exception:
-        working_path = video_path   # Fallback si ffmpeg absent
-
-    # ── 2. Durée via ffprobe ──────────────────────────────────────────────────
-    _p(0.1, "Lecture des métadonnées vidéo...")
-    duration_s = get_video_duration(working_path)
-    video_info = VideoDuration(duration_s)
-
-    # ── 3. Extraction audio via FFmpeg ────────────────────────────────────────
-    _p(0.2, "Extraction de l'audio...")
-    audio_path = os.path.join(CONFIG["TEMP_DIR"], "temp_audio.wav")
-    _run_ffmpeg([
-        "ffmpeg", "-y", "-i", working_path,
-        "-vn", "-acodec", "pcm_s16le", "-ar", "44100", "-ac", "2",
-        audio_path,
-    ])
-
-    # ── 4. Détection des silences via pydub ───────────────────────────────────
-    _p(0.5, "Chargement de l'audio...")
-    audio = AudioSegment.from_wav(audio_path)
 
+    # ── 4. Détection des silences (RMS vectorisé numpy) ──────────────────────
     _p(0.6, f"Détection des silences (seuil: {thresh} dB, min: {min_len} ms)...")
-    silences = pydub_silence.detect_silence(
-        audio,
-        min_silence_len=min_len,
-        silence_thresh=thresh,
-    )
+    silences = detect_silence_wav(audio_path, min_len, thresh)
+
+    if cache_path:
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({"duration": duration_s, "silences": silences,
+                           "working_path": working_path,
+                           "working_sig": _file_sig(working_path),
+                           "audio_sig": _file_sig(audio_path),
+                           "gop_1s": _has_gop_1s(working_path)}, f)
+        except OSError:
+            pass
 
     _p(1.0, f"{len(silences)} silence(s) détecté(s).")
     return video_info, silences, working_path
 
 
+def _init_analysis_worker(threads: int):
+    """Initialiseur des processus d'analyze_many : limite les threads FFmpeg."""
+    global _FFMPEG_THREADS
+    _FFMPEG_THREADS = threads
+
+
+def _analyze_one(video_path: str, probe_info: dict = None):
+    """Point d'entrée picklable pour analyze_many (un processus par vidéo).
+
+    `probe_info` : résultat ffprobe déjà obtenu par le parent, réinjecté
+    dans le cache du processus fils pour ne pas relancer ffprobe.
+    Retourne (résultat de l'analyse, working_path est une copie -g 30).
+    """
+    if probe_info:
+        path = os.path.abspath(video_path)
+        try:
+            st = os.stat(path)
+            _probe_cache_put(path, (st.st_size, st.st_mtime_ns), probe_info)
+        except OSError:
+            pass
+    result = extract_and_detect_silences(video_path)
+    return result, _has_gop_1s(result[2])
+
+
+def analyze_many(video_paths: list, max_workers: int = None) -> dict:
+    """
+    Analyse plusieurs vidéos en parallèle (un processus par fichier).
+
+    Chaque analyse lance ses propres FFmpeg, limités à cpu_count / max_workers
+    threads (4 par défaut) : libx264 sature vers 4 threads par encodage.
+    Retourne {chemin: (video_info, silences, working_path)} ; les vidéos en
+    échec sont absentes du résultat.
+    """
+    cpus = os.cpu_count() or 4
+    if max_workers is None:
+        max_workers = max(1, cpus // 4)
+    max_workers = min(max_workers, len(video_paths))
+    results = {}
+    if max_workers < 1:
+        return results
+    threads = max(1, cpus // max_workers)
+    # Les plus longues d'abord : la dernière vidéo lancée ne traîne pas seule
+    infos = probe_many(video_paths)
+
+    def _duration(path):
+        try:
+            return float(infos[path]["format"]["duration"])
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_analysis_worker,
+                             initargs=(threads,)) as pool:
+        futures = {path: pool.submit(_analyze_one, path, infos.get(path))
+                   for path in sorted(video_paths, key=_duration, reverse=True)}
+        for path in video_paths:
+            fut = futures[path]
+            try:
+                result, gop_1s = fut.result()
+                if gop_1s:
+                    _mark_gop_1s(result[2])    # registre du processus parent
+                results[path] = result
+            except Exception as e:
+                print_warn(f"Analyse échouée pour {os.path.basename(path)} : {e}")
+    return results
+
+
 # ==================================================================================
 # 4. PHASE 1b — ASSEMBLAGE DES CLIPS (FFmpeg Concat Demuxer)
 # ==================================================================================
@@ -222,36 +922,211 @@ def extract_and_detect_silences(video_path: str,
 def _build_keep_segments(silences, decisions, total_duration_ms: float):
     """
     Convertit une liste (silences à couper, décisions) en liste de segments à GARDER.
+    Les éclats de moins de CONFIG["MIN_KEEP_MS"] entre deux coupes sont
+    absorbés par les coupes (une entrée de concat et un flash en moins).
     Retourne list of (start_s, end_s).
     """
     cuts = sorted(
         [(s, e) for (s, e), d in zip(silences, decisions) if d],
         key=lambda x: x[0],
     )
+    min_keep = CONFIG.get("MIN_KEEP_MS", 0)
     keep = []
     pos = 0.0
     for cut_start, cut_end in cuts:
-        if cut_start > pos:
+        if cut_start - pos > min_keep:
             keep.append((pos / 1000.0, cut_start / 1000.0))
         pos = max(pos, cut_end)
-    if pos < total_duration_ms:
+    if total_duration_ms - pos > min_keep:
         keep.append((pos / 1000.0, total_duration_ms / 1000.0))
     return keep
 
 
+def _write_ffconcat(concat_path: str, entries):
+    """
+    Écrit un fichier ffconcat en une seule écriture.
+    `entries` : (fichier, inpoint, outpoint) ; bornes à None = fichier entier.
+    """
+    lines = ["ffconcat version 1.0\n"]
+    for path, start, end in entries:
+        file_ref = path.replace("\\", "/")
+        lines.append(f"file '{file_ref}'\n")
+        if start is not None:
+            lines.append(f"inpoint {start:.3f}\noutpoint {end:.3f}\n")
+    with open(concat_path, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
 def _create_concat_file(segments_keep, input_video: str, concat_path: str):
     """Écrit un fichier ffconcat listant les segments à conserver."""
-    file_ref = input_video.replace("\\", "/")
-    with open(concat_path, "w", encoding="utf-8") as f:
-        f.write("ffconcat version 1.0\n")
-        for start, end in segments_keep:
-            f.write(f"file '{file_ref}'\n")
-            f.write(f"inpoint {start:.3f}\n")
-            f.write(f"outpoint {end:.3f}\n")
+    _write_ffconcat(concat_path, ((input_video, start, end) for start, end in segments_keep))
+
+
+def _trim_concat_cmd(working_path: str, keep_segments, output_path: str,
+                     audio_path: str = None) -> list:
+    """
+    Commande d'assemblage par filtres trim/atrim + concat : la source est
+    ouverte et décodée une seule fois, sans réinitialiser le décodeur à
+    chaque segment comme le Concat Demuxer.
+    """
+    chains, pads = [], []
+    for i, (start, end) in enumerate(keep_segments):
+        chains.append(f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[v{i}]")
+        chains.append(f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[a{i}]")
+        pads.append(f"[v{i}][a{i}]")
+    a_out = "[acat]" if audio_path else "[aout]"
+    chains.append(f"{''.join(pads)}concat=n={len(keep_segments)}:v=1:a=1[vout]{a_out}")
+    if audio_path:
+        chains.append("[acat]asplit=2[aout][awhisper]")
+
+    cmd = [
+        "ffmpeg", "-y",
+        "-i", working_path,
+        "-filter_complex", ";".join(chains),
+        "-map", "[vout]", "-map", "[aout]",
+        *video_codec_args("fast"),
+        "-c:a", "aac", "-ac", "2", "-ar", "44100",
+        output_path,
+    ]
+    if audio_path:
+        # 2ème sortie : audio Whisper pré-extrait pendant l'assemblage
+        cmd.extend([
+            "-map", "[awhisper]",
+            "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+            audio_path,
+        ])
+    return cmd
+
+
+def _can_stream_copy(working_path: str, keep_segments) -> bool:
+    """
+    Vrai si l'assemblage peut se faire en copie de flux : option activée,
+    working_path ré-encodé par la passe CFR avec une image clé par seconde
+    (une source conforme ou un remux garde son GOP d'origine, souvent 2-10 s)
+    et segments d'au moins 1 s, pour que le recalage sur l'image clé
+    reste négligeable.
+    """
+    return (CONFIG.get("ASSEMBLY_STREAM_COPY", False)
+            and all(end - start >= 1.0 for start, end in keep_segments)
+            and _has_gop_1s(working_path))
+
+
+def _assembly_workers(n_segments: int) -> int:
+    """Nombre d'encodeurs parallèles pour l'assemblage (CONFIG["ASSEMBLY_WORKERS"])."""
+    workers = CONFIG.get("ASSEMBLY_WORKERS", 1)
+    if workers <= 0:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+        if detect_hw_encoder() != "libx264":
+            workers = min(workers, 2)   # sessions d'encodage GPU limitées
+    return max(1, min(workers, n_segments))
+
+
+def _split_by_duration(segments, n: int) -> list:
+    """
+    Découpe `segments` en au plus `n` groupes contigus de durées proches
+    (et non de même nombre de segments) : aucun encodeur ne reste seul
+    sur un groupe de longs segments pendant que les autres ont fini.
+    """
+    n = max(1, min(n, len(segments)))
+    remaining = sum(end - start for start, end in segments)
+    groups, current, acc = [], [], 0.0
+    for i, (start, end) in enumerate(segments):
+        dur = end - start
+        groups_left = n - len(groups)          # groupe courant compris
+        segs_left   = len(segments) - i        # segment courant compris
+        # Groupe fermé avant ce segment s'il dépasserait sa part de la durée
+        # restante de plus de la moitié du segment (ou s'il ne reste plus
+        # qu'un segment par groupe à remplir)
+        if current and groups_left > 1 and (acc + dur / 2 > remaining / groups_left
+                                            or segs_left == groups_left - 1):
+            groups.append(current)
+            remaining -= acc
+            current, acc = [], 0.0
+        current.append((start, end))
+        acc += dur
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _assemble_parallel(keep_segments, working_path: str, output_path: str,
+                       workers: int, _p, report: bool, audio_path: str = None):
+    """
+    Assemblage découpé : chaque groupe contigu de segments (durées
+    équilibrées) est encodé par son propre FFmpeg (MKV, audio PCM pour
+    éviter les décalages AAC aux jointures), puis les morceaux sont
+    recollés sans réencodage vidéo.
+    """
+    groups = _split_by_duration(keep_segments, workers)
+    threads = max(1, (os.cpu_count() or 2) // len(groups))
+    total = sum(end - start for start, end in keep_segments) or 1.0
+    done = [0.0] * len(groups)
+    lock = threading.Lock()
+    temp_dir = CONFIG["TEMP_DIR"]
+    n_groups = len(groups)
+    concat_paths = [os.path.join(temp_dir, f"cuts_part{i:02d}.ffconcat") for i in range(n_groups)]
+    parts        = [os.path.join(temp_dir, f"cut_part{i:02d}.mkv") for i in range(n_groups)]
+    list_path    = os.path.join(temp_dir, "cut_parts.ffconcat")
+
+    def _encode_group(idx, group):
+        concat_path, part_path = concat_paths[idx], parts[idx]
+        _create_concat_file(group, working_path, concat_path)
+        group_dur = sum(end - start for start, end in group)
+
+        def _report(f):
+            with lock:
+                done[idx] = f * group_dur
+                frac = sum(done) / total
+                _p(0.3 + 0.6 * frac, f"Encodage FFmpeg ({len(groups)} flux)... {int(frac * 100)}%")
+
+        _run_ffmpeg([
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0", "-segment_time_metadata", "1",
+            "-i", concat_path,
+            *video_codec_args("fast"), "-threads", str(threads),
+            "-c:a", "pcm_s16le", "-ac", "2", "-ar", "44100",
+            "-af", "aresample=async=1000",
+            "-max_interleave_delta", "0",
+            "-avoid_negative_ts", "make_zero",
+            part_path,
+        ], msg=f"Encodage FFmpeg (morceau {idx + 1})...",
+            progress_callback=_report if report else None, duration=group_dur)
+        return part_path
+
+    # Encodage + jonction sous un seul try : en cas d'échec d'un morceau,
+    # les morceaux déjà écrits et les listes ffconcat sont aussi supprimés
+    try:
+        _p(0.3, f"Encodage FFmpeg en parallèle ({len(groups)} flux)...")
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            list(pool.map(_encode_group, range(len(groups)), groups))
+
+        _p(0.9, "Jonction des morceaux...")
+        _write_ffconcat(list_path, ((part, None, None) for part in parts))
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", list_path,
+            "-c:v", "copy", "-c:a", "aac",
+            "-avoid_negative_ts", "make_zero",
+            output_path,
+        ]
+        if audio_path:
+            cmd.extend([
+                "-map", "0:a", "-vn",
+                "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+                audio_path,
+            ])
+        _run_ffmpeg(cmd, msg="Jonction FFmpeg (concat copy)...")
+    finally:
+        for path in (*parts, *concat_paths, list_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 def assemble_clips(working_path: str, silences, decisions, output_path: str,
-                   progress_callback=None) -> str:
+                   progress_callback=None, audio_path: str = None) -> str:
     """
     Phase 1b : Assemble la vidéo en supprimant les silences.
     Utilise le Concat Demuxer FFmpeg — rapide, zéro RAM, synchronisation parfaite.
@@ -266,6 +1141,9 @@ def assemble_clips(working_path: str, silences, decisions, output_path: str,
         True = couper ce silence.
     output_path : str
         Où sauvegarder la vidéo assemblée.
+    audio_path : str, optional
+        Si fourni, écrit aussi le WAV mono 16 kHz destiné à Whisper dans la
+        même passe FFmpeg (évite un second décodage dans transcribe()).
 
     Retourne
     --------
@@ -285,41 +1163,238 @@ def assemble_clips(working_path: str, silences, decisions, output_path: str,
         raise RuntimeError("Aucun segment à garder après les coupes.")
 
     _p(0.1, f"Assemblage de {len(keep_segments)} segment(s) via FFmpeg...")
-    concat_file = os.path.join(CONFIG["TEMP_DIR"], "cuts.ffconcat")
-    _create_concat_file(keep_segments, working_path, concat_file)
-
-    _p(0.3, "Encodage FFmpeg en cours (Concat Demuxer)...")
-    _run_ffmpeg([
-        "ffmpeg", "-y",
-        "-f", "concat",
-        "-safe", "0",
-        "-segment_time_metadata", "1",
-        "-i", concat_file,
-        "-c:v", "libx264", "-preset", "veryfast",
-        "-c:a", "aac",
-        "-ac", "2",
-        "-ar", "44100",
-        "-af", "aresample=async=1000",
-        "-max_interleave_delta", "0",
-        "-avoid_negative_ts", "make_zero",
-        output_path,
-    ], msg="Encodage FFmpeg (concat)...")
+    if _can_stream_copy(working_path, keep_segments):
+        # Concat Demuxer en copie : aucun décodage/encodage vidéo
+        concat_file = os.path.join(CONFIG["TEMP_DIR"], "cuts.ffconcat")
+        _create_concat_file(keep_segments, working_path, concat_file)
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", concat_file,
+            "-map", "0:v", "-map", "0:a",
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            output_path,
+        ]
+        if audio_path:
+            cmd.extend(["-map", "0:a", "-vn", *_ANALYSIS_AUDIO_ARGS, audio_path])
+        _p(0.3, "Assemblage FFmpeg en cours (copie des flux)...")
+        copy_cb = None
+        if progress_callback:
+            copy_cb = lambda f: _p(0.3 + 0.7 * f, f"Copie des flux... {int(f * 100)}%")
+        copy_duration = sum(end - start for start, end in keep_segments)
+        _run_ffmpeg(cmd, msg="Assemblage FFmpeg (copie des flux)...", progress_callback=copy_cb,
+                    duration=copy_duration)
+        _remember_duration(output_path, copy_duration)
+        _p(1.0, f"Assemblage terminé : {output_path}")
+        return output_path
+
+    workers = _assembly_workers(len(keep_segments))
+    if workers > 1:
+        _assemble_parallel(keep_segments, working_path, output_path, workers,
+                           _p, progress_callback is not None, audio_path)
+        _remember_duration(output_path, sum(end - start for start, end in keep_segments))
+        _p(1.0, f"Assemblage terminé : {output_path}")
+        return output_path
+
+    max_trim = CONFIG.get("TRIM_FILTER_MAX_SEGMENTS") or 0
+    if len(keep_segments) <= max_trim and _audio_codec(working_path):
+        # Peu de segments : un seul décodage de la source, découpe par trim/atrim
+        _p(0.3, "Encodage FFmpeg en cours (trim + concat)...")
+        cmd = _trim_concat_cmd(working_path, keep_segments, output_path, audio_path)
+    else:
+        concat_file = os.path.join(CONFIG["TEMP_DIR"], "cuts.ffconcat")
+        _create_concat_file(keep_segments, working_path, concat_file)
+
+        _p(0.3, "Encodage FFmpeg en cours (Concat Demuxer)...")
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-segment_time_metadata", "1",
+            "-i", concat_file,
+            *video_codec_args("fast"),
+            "-c:a", "aac",
+            "-ac", "2",
+            "-ar", "44100",
+            "-af", "aresample=async=1000",
+            "-max_interleave_delta", "0",
+            "-avoid_negative_ts", "make_zero",
+            output_path,
+        ]
+        if audio_path:
+            # 2ème sortie : audio Whisper pré-extrait pendant l'assemblage
+            cmd.extend([
+                "-map", "0:a", "-vn",
+                "-af", "aresample=async=1000",
+                "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+                audio_path,
+            ])
+    enc_cb = None
+    if progress_callback:
+        enc_cb = lambda f: _p(0.3 + 0.7 * f, f"Encodage FFmpeg... {int(f * 100)}%")
+    out_duration = sum(end - start for start, end in keep_segments)
+    _run_ffmpeg(cmd, msg="Encodage FFmpeg (assemblage)...", progress_callback=enc_cb,
+                duration=out_duration)
+    _remember_duration(output_path, out_duration)
 
     _p(1.0, f"Assemblage terminé : {output_path}")
     return output_path
 
 
 def save_raw_cut(working_path: str, silences, decisions, output_path: str,
-                 progress_callback=None) -> str:
+                 progress_callback=None, audio_path: str = None) -> str:
     """Alias de assemble_clips (compatibilité avec les anciens appels CLI)."""
-    return assemble_clips(working_path, silences, decisions, output_path, progress_callback)
+    return assemble_clips(working_path, silences, decisions, output_path,
+                          progress_callback, audio_path)
 
 
 # ==================================================================================
 # 5. PHASE 2 — TRANSCRIPTION WHISPER (GUI-CALLABLE)
 # ==================================================================================
 
-def transcribe(video_path: str, progress_callback=None):
+_WHISPER_MODELS = {}             # (taille, device, compute_type) → WhisperModel
+_WHISPER_BATCHED = {}            # même clé → BatchedInferencePipeline (GPU)
+_WHISPER_LOCK   = threading.Lock()
+_GPU_ERROR      = None           # 1re erreur GPU : les appels suivants passent direct au CPU
+
+
+@lru_cache(maxsize=None)
+def cpu_compute_type() -> str:
+    """
+    Meilleur type int8 CPU supporté par CTranslate2 sur cette machine
+    (int8_bfloat16 sur les CPU AVX512-BF16/AMX, sinon int8). Sondé une fois.
+    """
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types("cpu")
+    except Exception:
+        return "int8"
+    for ctype in ("int8_bfloat16", "int8"):
+        if ctype in supported:
+            return ctype
+    return "int8"
+
+
+def get_whisper_model(device: str, compute_type: str, model_size: str = None):
+    """
+    WhisperModel partagé par processus : chargé au premier appel, réutilisé
+    ensuite (évite plusieurs secondes de chargement par vidéo).
+
+    Le modèle est « chauffé » au chargement sur 1 s de silence : l'init
+    CUDA/CTranslate2 est payée ici (ou pendant un préchargement) plutôt
+    qu'au début de la vraie transcription.
+    """
+    key = (model_size or CONFIG["WHISPER_MODEL_SIZE"], device, compute_type)
+    with _WHISPER_LOCK:
+        model = _WHISPER_MODELS.get(key)
+        if model is None:
+            from faster_whisper import WhisperModel  # import lazy — DLLs chargés ici seulement
+            kwargs = {}
+            if device == "cpu":
+                # faster-whisper se limite à 4 threads par défaut
+                kwargs["cpu_threads"] = os.cpu_count() or 4
+            model = WhisperModel(key[0], device=device, compute_type=compute_type, **kwargs)
+            segs, _ = model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1)
+            for _ in segs:      # générateur paresseux : le consommer lance le calcul
+                pass
+            _WHISPER_MODELS[key] = model
+    return model
+
+
+def get_batched_pipeline(device: str, compute_type: str, model_size: str = None):
+    """BatchedInferencePipeline autour du modèle partagé (créé une fois par clé)."""
+    model = get_whisper_model(device, compute_type, model_size)
+    key = (model_size or CONFIG["WHISPER_MODEL_SIZE"], device, compute_type)
+    with _WHISPER_LOCK:
+        pipeline = _WHISPER_BATCHED.get(key)
+        if pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+            pipeline = BatchedInferencePipeline(model=model)
+            _WHISPER_BATCHED[key] = pipeline
+    return pipeline
+
+
+def drop_whisper_model(device: str, compute_type: str, model_size: str = None):
+    """Retire un modèle (et son pipeline batché) du cache, ex. après un crash CUDA."""
+    key = (model_size or CONFIG["WHISPER_MODEL_SIZE"], device, compute_type)
+    with _WHISPER_LOCK:
+        _WHISPER_BATCHED.pop(key, None)
+        _WHISPER_MODELS.pop(key, None)
+
+
+def _gpu_error_msg(e) -> str:
+    """Message court et lisible pour une erreur GPU (CUDA / cuDNN / VRAM)."""
+    s = str(e).lower()
+    if "cudnn" in s or "libcudnn" in s:
+        return "cuDNN introuvable"
+    if "cublas" in s or "libcublas" in s:
+        return "cuBLAS introuvable"
+    if "cuda" in s and any(k in s for k in ("not found", "failed", "unavailable")):
+        return "CUDA non disponible"
+    if "out of memory" in s or "oom" in s:
+        return "VRAM insuffisante"
+    return str(e)[:120]
+
+
+_PRELOAD_POOL = None     # ThreadPoolExecutor(1) créé au premier préchargement
+
+
+def _preload_whisper():
+    """Charge (et chauffe) le modèle que transcribe() utilisera ensuite."""
+    global _GPU_ERROR
+    if CONFIG["DEVICE"] == "cuda" and _GPU_ERROR is None:
+        try:
+            get_whisper_model(CONFIG["DEVICE"], CONFIG["COMPUTE_TYPE"])
+            return
+        except Exception as e:
+            _GPU_ERROR = _gpu_error_msg(e)
+    try:
+        get_whisper_model("cpu", cpu_compute_type())
+    except Exception:
+        pass    # transcribe() refera la tentative et remontera l'erreur
+
+
+def preload_whisper_model():
+    """
+    Lance le chargement du modèle Whisper en arrière-plan (ex. pendant
+    l'encodage de l'assemblage). transcribe() attend simplement la fin du
+    chargement via le verrou du cache au lieu de le refaire.
+    """
+    global _PRELOAD_POOL
+    if _PRELOAD_POOL is None:
+        _PRELOAD_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-preload")
+    return _PRELOAD_POOL.submit(_preload_whisper)
+
+
+def _audio_digest(wav_path: str):
+    """Empreinte blake2b du contenu d'un WAV (None si illisible)."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(wav_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def _transcript_cache_path(audio_digest: str, device: str, compute_type: str):
+    """
+    Cache JSON d'une transcription, clé = empreinte du WAV + réglages Whisper
+    + device/précision/lots réellement utilisés : un même montage n'est
+    transcrit qu'une fois, mais un résultat du repli CPU int8 ne sert pas
+    une fois le GPU de nouveau disponible.
+    """
+    batch_size = (CONFIG.get("WHISPER_BATCH_SIZE") or 0) if device == "cuda" else 0
+    raw = (f"{audio_digest}:{CONFIG['WHISPER_MODEL_SIZE']}:{CONFIG.get('WHISPER_VAD')}:"
+           f"{CONFIG['MIN_SILENCE_LEN']}:{CONFIG.get('WORD_TIMESTAMPS', True)}:"
+           f"{device}:{compute_type}:{batch_size}")
+    key = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return os.path.join(CONFIG["TEMP_DIR"], f"transcript_{key}.json")
+
+
+def transcribe(video_path: str, progress_callback=None, audio_path: str = None):
     """
     Phase 2 : Transcription Whisper sur un fichier vidéo.
     Écrit temp_subs.txt (éditable dans le GUI) et temp_subs.srt (pour FFmpeg).
@@ -328,12 +1403,17 @@ def transcribe(video_path: str, progress_callback=None):
     ----------
     video_path : str
         Chemin vers la vidéo coupée (Raw_Cut).
+    audio_path : str, optional
+        WAV mono 16 kHz déjà extrait (cf. assemble_clips). Si absent ou
+        inexistant, l'audio est extrait depuis video_path.
 
     Retourne
     --------
     words_data : list of {'start', 'end', 'word'}
     txt_path   : str — chemin vers temp_subs.txt
     """
+    global _GPU_ERROR
+
     def _p(p, msg):
         if progress_callback:
             progress_callback(p, msg)
@@ -341,90 +1421,136 @@ def transcribe(video_path: str, progress_callback=None):
             print_info(msg)
 
     # Extraction audio pour Whisper (mono 16 kHz — optimal)
-    temp_audio = os.path.join(CONFIG["TEMP_DIR"], "cut_audio.wav")
-    _p(0.0, "Extraction audio pour transcription...")
-    _run_ffmpeg([
-        "ffmpeg", "-y", "-i", video_path,
-        "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
-        temp_audio,
-    ])
+    if audio_path and os.path.isfile(audio_path):
+        temp_audio = audio_path
+        _p(0.0, "Audio pré-extrait pendant l'assemblage.")
+    else:
+        temp_audio = os.path.join(CONFIG["TEMP_DIR"], "cut_audio.wav")
+        # Le modèle se charge (GPU/disque) pendant que FFmpeg extrait l'audio (CPU)
+        preload_whisper_model()
+        _p(0.0, "Extraction audio pour transcription...")
+        _run_ffmpeg([
+            "ffmpeg", "-y", "-i", video_path,
+            "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+            temp_audio,
+        ])
 
     def _run_whisper(device_type, compute_type, label=""):
-        from faster_whisper import WhisperModel  # import lazy — DLLs chargés ici seulement
-        _p(0.3, f"Chargement modèle Whisper ({label})...")
-        model = WhisperModel(
-            CONFIG["WHISPER_MODEL_SIZE"],
-            device=device_type,
-            compute_type=compute_type,
-        )
+        key = (CONFIG["WHISPER_MODEL_SIZE"], device_type, compute_type)
+        if key not in _WHISPER_MODELS:
+            _p(0.3, f"Chargement modèle Whisper ({label})...")
+        kwargs = {}
+        batch_size = CONFIG.get("WHISPER_BATCH_SIZE") or 0
+        if device_type == "cuda" and batch_size > 0:
+            # Mode batché (plus de VRAM) : découpe par VAD obligatoire
+            model = get_batched_pipeline(device_type, compute_type)
+            kwargs["batch_size"] = batch_size
+            kwargs["vad_filter"] = True
+        else:
+            model = get_whisper_model(device_type, compute_type)
+            kwargs["vad_filter"] = bool(CONFIG.get("WHISPER_VAD"))
+        if kwargs["vad_filter"]:
+            kwargs["vad_parameters"] = {"min_silence_duration_ms": CONFIG["MIN_SILENCE_LEN"]}
         _p(0.5, f"Transcription ({label})...")
-        segs, _ = model.transcribe(temp_audio, word_timestamps=True)
+        segs, _ = model.transcribe(temp_audio,
+                                   word_timestamps=CONFIG.get("WORD_TIMESTAMPS", True),
+                                   **kwargs)
         return list(segs)
 
     def _is_dll_error(e):
         s = str(e)
         return "WinError 1114" in s or "c10.dll" in s
 
-    def _gpu_error_msg(e):
-        s = str(e).lower()
-        if "cudnn" in s or "libcudnn" in s:
-            return "cuDNN introuvable"
-        if "cublas" in s or "libcublas" in s:
-            return "cuBLAS introuvable"
-        if "cuda" in s and any(k in s for k in ("not found", "failed", "unavailable")):
-            return "CUDA non disponible"
-        if "out of memory" in s or "oom" in s:
-            return "VRAM insuffisante"
-        return str(e)[:120]
-
-    # ── Tentative GPU, fallback CPU ───────────────────────────────────────────
-    gpu_used = False
-    gpu_err  = None
-
-    if CONFIG["DEVICE"] == "cuda":
-        try:
-            segments_list = _run_whisper(CONFIG["DEVICE"], CONFIG["COMPUTE_TYPE"], "GPU CUDA")
-            gpu_used = True
-            _p(0.55, "Transcription GPU en cours...")
-        except Exception as e:
-            gpu_err = _gpu_error_msg(e)
-            _p(0.4, f"GPU échoué ({gpu_err}) — bascule CPU...")
+    # ── Cache : même audio, mêmes réglages → pas de nouvelle passe Whisper ──
+    # Recherché pour le device que l'on s'apprête à utiliser
+    audio_digest = _audio_digest(temp_audio)
 
-    if not gpu_used:
+    def _cache_for(on_gpu):
+        if on_gpu:
+            return _transcript_cache_path(audio_digest, CONFIG["DEVICE"], CONFIG["COMPUTE_TYPE"])
+        return _transcript_cache_path(audio_digest, "cpu", cpu_compute_type())
+
+    cache_path = None
+    if audio_digest:
+        cache_path = _cache_for(CONFIG["DEVICE"] == "cuda" and _GPU_ERROR is None)
+    words_data = None
+    if cache_path and os.path.exists(cache_path):
         try:
-            segments_list = _run_whisper("cpu", "int8", "CPU")
-            _p(0.55, "Transcription CPU en cours...")
-        except Exception as cpu_e:
-            if _is_dll_error(cpu_e):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                words_data = json.load(f)
+            _p(0.9, "Transcription identique trouvée en cache.")
+        except (OSError, ValueError):
+            words_data = None
+
+    if words_data is None:
+        # ── Tentative GPU, fallback CPU ───────────────────────────────────────
+        gpu_used = False
+        gpu_err  = _GPU_ERROR
+
+        if CONFIG["DEVICE"] == "cuda" and gpu_err is None:
+            try:
+                segments_list = _run_whisper(CONFIG["DEVICE"], CONFIG["COMPUTE_TYPE"], "GPU CUDA")
+                gpu_used = True
+                _p(0.55, "Transcription GPU en cours...")
+            except Exception as e:
+                gpu_err = _GPU_ERROR = _gpu_error_msg(e)
+                drop_whisper_model(CONFIG["DEVICE"], CONFIG["COMPUTE_TYPE"])
+                _p(0.4, f"GPU échoué ({gpu_err}) — bascule CPU...")
+
+        if not gpu_used:
+            try:
+                segments_list = _run_whisper("cpu", cpu_compute_type(), "CPU")
+                _p(0.55, "Transcription CPU en cours...")
+            except Exception as cpu_e:
+                if _is_dll_error(cpu_e):
+                    raise RuntimeError(
+                        "ctranslate2 ne peut pas charger ses DLLs.\n"
+                        f"Erreur GPU : {gpu_err or 'N/A'}\n"
+                        f"Erreur CPU : {cpu_e}\n\n"
+                        "Réinstallez PyTorch CPU-only :\n"
+                        "  pip install torch --index-url https://download.pytorch.org/whl/cpu"
+                    ) from None
                 raise RuntimeError(
-                    "ctranslate2 ne peut pas charger ses DLLs.\n"
-                    f"Erreur GPU : {gpu_err or 'N/A'}\n"
-                    f"Erreur CPU : {cpu_e}\n\n"
-                    "Réinstallez PyTorch CPU-only :\n"
-                    "  pip install torch --index-url https://download.pytorch.org/whl/cpu"
-                ) from None
-            raise RuntimeError(
-                f"Transcription CPU échouée : {cpu_e}\n"
-                f"(Erreur GPU initiale : {gpu_err or 'N/A'})"
-            ) from cpu_e
-
-    # Construire la liste de mots
-    words_data = []
-    for seg in segments_list:
-        if seg.words:
-            for w in seg.words:
-                words_data.append({
-                    "start": w.start,
-                    "end":   w.end,
-                    "word":  w.word.strip(),
-                })
+                    f"Transcription CPU échouée : {cpu_e}\n"
+                    f"(Erreur GPU initiale : {gpu_err or 'N/A'})"
+                ) from cpu_e
+
+        # Construire la liste de mots
+        words_data = []
+        for seg in segments_list:
+            if seg.words:
+                for w in seg.words:
+                    words_data.append({
+                        "start": w.start,
+                        "end":   w.end,
+                        "word":  w.word.strip(),
+                    })
+            else:
+                # Sans horodatage par mot : durée du segment répartie à parts égales
+                tokens = seg.text.split()
+                step = (seg.end - seg.start) / max(1, len(tokens))
+                for k, token in enumerate(tokens):
+                    words_data.append({
+                        "start": seg.start + k * step,
+                        "end":   seg.start + (k + 1) * step,
+                        "word":  token,
+                    })
+
+        if audio_digest:
+            # Clé du device effectivement utilisé (CPU si le GPU a échoué)
+            cache_path = _cache_for(gpu_used)
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(words_data, f, ensure_ascii=False)
+            except OSError:
+                pass
 
     # ── Écriture temp_subs.txt (pour le GUI) ─────────────────────────────────
     txt_path = os.path.join(CONFIG["TEMP_DIR"], "temp_subs.txt")
+    lines = ["# START | END | WORD\n"]
+    lines.extend(f"{wd['start']:.2f} | {wd['end']:.2f} | {wd['word']}\n" for wd in words_data)
     with open(txt_path, "w", encoding="utf-8") as f:
-        f.write("# START | END | WORD\n")
-        for wd in words_data:
-            f.write(f"{wd['start']:.2f} | {wd['end']:.2f} | {wd['word']}\n")
+        f.write("".join(lines))     # une seule écriture pour tout le fichier
 
     # ── Écriture temp_subs.srt (pour la gravure FFmpeg) ───────────────────────
     srt_path = os.path.join(CONFIG["TEMP_DIR"], "temp_subs.srt")
@@ -458,6 +1584,25 @@ def load_subs_from_file(txt_path: str) -> list:
 # 6. PHASE 3 — GRAVURE DES SOUS-TITRES (FFmpeg subtitles filter)
 # ==================================================================================
 
+@lru_cache(maxsize=None)
+def subtitles_fontsdir_opt() -> str:
+    """
+    Option `:fontsdir=...` du filtre subtitles si assets/ contient des
+    polices (.ttf/.otf) : Poppins est trouvée sans être installée sur le
+    système. Un seul scandir par session ; "" si aucune police.
+    """
+    assets = CONFIG["ASSETS_DIR"]
+    try:
+        with os.scandir(assets) as it:
+            has_fonts = any(e.is_file() and e.name.lower().endswith((".ttf", ".otf"))
+                            for e in it)
+    except OSError:
+        return ""
+    if not has_fonts:
+        return ""
+    return f":fontsdir='{assets.translate(_FFMPEG_PATH_TRANS)}'"
+
+
 def burn_subtitles(video_path: str, words_data: list, output_path: str,
                    progress_callback=None,
                    music_path: str = None, music_volume: float = 0.15,
@@ -496,14 +1641,14 @@ def burn_subtitles(video_path: str, words_data: list, output_path: str,
     _write_srt_grouped(words_data, srt_path, max_words=1)
 
     # Échappement du chemin pour le filtre FFmpeg (Windows)
-    srt_esc = srt_path.replace("\\", "/").replace(":", "\\:")
+    srt_esc = srt_path.translate(_FFMPEG_PATH_TRANS)
     sub_style = CONFIG["SUB_STYLE"].replace("{margin_v}", str(margin_v))
-    vf_chain = f"subtitles='{srt_esc}':force_style='{sub_style}'"
+    vf_chain = f"subtitles='{srt_esc}'{subtitles_fontsdir_opt()}:force_style='{sub_style}'"
 
     # Intro (flou + titre texte)
     if intro_title and intro_title.strip():
         _p(0.05, f"Ajout de l'intro : '{intro_title}'...")
-        title_esc = intro_title.replace("'", "\\'").replace(":", "\\:")
+        title_esc = intro_title.translate(_FFMPEG_TEXT_TRANS)
         intro_vf = (
             f"boxblur=20:5:enable='between(t,0,2.5)',"
             f"drawtext=text='{title_esc}':fontcolor=white:fontsize=90:"
@@ -513,21 +1658,10 @@ def burn_subtitles(video_path: str, words_data: list, output_path: str,
         )
         vf_chain = f"{intro_vf},{vf_chain}"
 
-    # Détection NVENC
+    # Encodeur matériel (NVENC / QSV / VideoToolbox / AMF), sondé une fois
     _p(0.1, "Détection du codec disponible...")
-    codec = "libx264"
-    try:
-        res = subprocess.run(
-            ["ffmpeg", "-encoders"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            creationflags=_CREATIONFLAGS,
-        )
-        if b"h264_nvenc" in res.stdout:
-            codec = "h264_nvenc"
-            _p(0.15, "NVENC GPU détecté.")
-    except Exception:
-        pass
+    codec_args = video_codec_args("final")
+    codec = codec_args[1]
 
     cmd = [
         "ffmpeg", "-y",
@@ -545,21 +1679,28 @@ def burn_subtitles(video_path: str, words_data: list, output_path: str,
             f"[0:a][bg]amix=inputs=2:duration=first:dropout_transition=2[aout]"
         )
 
-    cmd.extend(["-vf", vf_chain])
-
     if af_chain:
-        cmd.extend(["-filter_complex", af_chain, "-map", "0:v", "-map", "[aout]"])
-
-    cmd.extend(["-c:v", codec, "-pix_fmt", "yuv420p"])
+        # Un seul graphe : sous-titres/intro sur la vidéo + mixage musique
+        cmd.extend(["-filter_complex", f"[0:v]{vf_chain}[vout];{af_chain}",
+                    "-map", "[vout]", "-map", "[aout]"])
+    else:
+        cmd.extend(["-vf", vf_chain])
 
-    if codec == "libx264":
-        cmd.extend(["-preset", "slow", "-crf", "21"])
+    cmd.extend(codec_args)
+    cmd.extend(["-pix_fmt", "yuv420p"])
+    if af_chain is None and _audio_codec(video_path) == "aac":
+        # Pas de mixage : l'AAC du Raw_Cut est recopié tel quel
+        cmd.extend(["-c:a", "copy", output_path])
     else:
-        cmd.extend(["-preset", "p4", "-rc", "vbr", "-cq", "22", "-b:v", "5M"])
-    cmd.extend(["-c:a", "aac", "-b:a", "192k", output_path])
+        cmd.extend(["-c:a", "aac", "-b:a", "192k", output_path])
 
-    _p(0.2, f"Rendu final ({'NVENC GPU' if codec == 'h264_nvenc' else 'CPU libx264'})...")
-    _run_ffmpeg(cmd, msg="Rendu FFmpeg (gravure sous-titres)...")
+    _p(0.2, f"Rendu final ({codec})...")
+    render_cb, render_dur = None, 0.0
+    if progress_callback:
+        render_cb  = lambda f: _p(0.2 + 0.8 * f, f"Rendu final... {int(f * 100)}%")
+        render_dur = get_video_duration(video_path)
+    _run_ffmpeg(cmd, msg="Rendu FFmpeg (gravure sous-titres)...",
+                progress_callback=render_cb, duration=render_dur)
 
     _p(1.0, f"Export terminé : {output_path}")
     return output_path
@@ -569,11 +1710,16 @@ def burn_subtitles(video_path: str, words_data: list, output_path: str,
 # 7. CLI LEGACY — usage : python reel_maker.py (toujours fonctionnel)
 # ==================================================================================
 
-def fast_cut_workflow(video_path: str):
-    """CLI : détection interactive des silences et assemblage."""
+def fast_cut_workflow(video_path: str, analysis=None):
+    """CLI : détection interactive des silences et assemblage.
+
+    `analysis` : résultat déjà calculé par analyze_many (sinon analyse ici).
+    """
     import msvcrt
     print_step("Phase 1 : Détection des silences")
-    video_info, silences, working_path = extract_and_detect_silences(video_path)
+    if analysis is None:
+        analysis = extract_and_detect_silences(video_path)
+    video_info, silences, working_path = analysis
     print_info(f"{len(silences)} silence(s) détecté(s).")
 
     decisions = []
@@ -609,28 +1755,36 @@ def fast_cut_workflow(video_path: str):
     name_root = os.path.splitext(os.path.basename(video_path))[0]
     raw_cut_path = os.path.join(CONFIG["OUTPUT_DIR"], f"Raw_Cut_{name_root}.mp4")
     print_step(f"Assemblage → {raw_cut_path}")
-    assemble_clips(working_path, silences, decisions, raw_cut_path)
+    preload_whisper_model()   # le modèle se charge pendant l'encodage
+    assemble_clips(working_path, silences, decisions, raw_cut_path,
+                   audio_path=CUT_AUDIO_PATH)
     return raw_cut_path
 
 
 def main():
     print(f"{Fore.MAGENTA}=== REEL MAKER : CUT & SUB ==={Style.RESET_ALL}")
-    files = [f for f in os.listdir(CONFIG["INPUT_DIR"])
-             if f.lower().endswith((".mp4", ".mov", ".mkv"))]
+    files = list_videos(CONFIG["INPUT_DIR"])
     if not files:
         print_warn(f"Aucune vidéo dans {CONFIG['INPUT_DIR']}")
         return
 
+    # Plusieurs vidéos : toutes les analyses tournent en parallèle avant
+    # la partie interactive, qui reste séquentielle.
+    analyses = {}
+    if len(files) > 1:
+        print_step(f"Analyse des silences de {len(files)} vidéos en parallèle")
+        analyses = analyze_many([os.path.join(CONFIG["INPUT_DIR"], f) for f in files])
+
     for filename in files:
         print(f"\n{Fore.CYAN}--- {filename} ---{Style.RESET_ALL}")
         target_vid = os.path.join(CONFIG["INPUT_DIR"], filename)
         name_root  = os.path.splitext(filename)[0]
 
         try:
-            raw_cut_path = fast_cut_workflow(target_vid)
+            raw_cut_path = fast_cut_workflow(target_vid, analyses.get(target_vid))
 
             print_step("Phase 2 : Transcription Whisper")
-            words_data, txt_path = transcribe(raw_cut_path)
+            words_data, txt_path = transcribe(raw_cut_path, audio_path=CUT_AUDIO_PATH)
             print(f"\n{Fore.CYAN}Sous-titres : {txt_path}")
             input(f"{Fore.WHITE}Éditez si besoin, puis [ENTRÉE] pour continuer...{Style.RESET_ALL}")
 